@@ -1,6 +1,7 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 # Get database URL from environment variable, default to SQLite for development
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data.db")
@@ -9,6 +10,25 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+# The application uses async drivers (asyncpg / aiosqlite); DATABASE_URL stays
+# a sync URL for Alembic
+if DATABASE_URL.startswith("postgresql://"):
+    ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+elif DATABASE_URL.startswith("sqlite://"):
+    ASYNC_DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+else:
+    ASYNC_DATABASE_URL = DATABASE_URL
+
+# Connection pool sizing (Postgres only - SQLite uses a single file)
+#   DB_POOL_SIZE:     persistent connections kept open (default: 20)
+#   DB_MAX_OVERFLOW:  extra connections allowed under burst load (default: 30)
+#   DB_POOL_TIMEOUT:  seconds to wait for a free connection (default: 30)
+#   DB_POOL_RECYCLE:  seconds before a connection is recycled (default: 1800)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 30))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+
 # Lazy initialization - engine and session created on first use
 _engine = None
 _SessionLocal = None
@@ -17,32 +37,61 @@ Base = declarative_base()
 
 
 def get_engine():
-    """Get SQLAlchemy engine (lazy-initialized on first call)."""
+    """Get async SQLAlchemy engine (lazy-initialized on first call)."""
     global _engine
     if _engine is None:
         if DATABASE_URL.startswith("sqlite"):
-            _engine = create_engine(
-                DATABASE_URL,
-                connect_args={"check_same_thread": False}
-            )
+            _engine = create_async_engine(ASYNC_DATABASE_URL)
         else:
-            _engine = create_engine(DATABASE_URL)
+            _engine = create_async_engine(
+                ASYNC_DATABASE_URL,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_recycle=DB_POOL_RECYCLE,
+                pool_pre_ping=True
+            )
     return _engine
 
 
 def get_session_factory():
-    """Get the session factory (lazy-initialized)."""
+    """Get the async session factory (lazy-initialized)."""
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+        _SessionLocal = async_sessionmaker(
+            bind=get_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
     return _SessionLocal
 
 
-def get_db():
-    """Dependency for FastAPI to get database session."""
+async def get_db():
+    """Dependency for FastAPI to get an async database session."""
     SessionLocal = get_session_factory()
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def warm_pool() -> int:
+    """
+    Open and release pool_size connections so the first requests after boot
+    don't pay connection-establishment latency.
+
+    Returns:
+        Number of connections warmed (0 for SQLite)
+    """
+    if DATABASE_URL.startswith("sqlite"):
+        return 0
+    engine = get_engine()
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(engine.pool.size())),
+        return_exceptions=True
+    )
+    conns = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in conns))
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+    return len(conns)
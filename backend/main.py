@@ -10,25 +10,51 @@ Features:
 """
 
 import os
+import math
 import time
+import asyncio
 import logging
-from collections import defaultdict
+import gzip
+import hashlib
+import mimetypes
+import orjson
+from email.utils import formatdate, parsedate
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 
 from routers import noaa, location, geocode
 from routers.ralph_callback import router as ralph_callback_router, setup_ralph_logging
 from routers.research import router as research_router
 from services.task_scheduler import task_scheduler
-from utils.responses import success_response, error_response, ErrorCodes
+from services.http_client import get_http_client, close_http_client
+from database import warm_pool
+from utils.responses import (
+    success_response,
+    error_response,
+    response_meta,
+    add_camel_case_aliases,
+    ErrorCodes,
+    ErrorTemplate,
+    ORJSONResponse,
+)
 from services import ralph_monitor
 from middleware.ralph_error import RalphErrorMiddleware
 
+try:
+    import brotli
+except ImportError:  # Optional - gzip alone still covers every browser
+    brotli = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,9 +70,176 @@ logger = logging.getLogger(__name__)
 # Path to the frontend build directory
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
 
+# Cache policy for Vite's content-hashed build assets
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Cache policy for other root-level build files (vite.svg, favicons)
+STATIC_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+# Files above this size stay on disk so FileResponse can use sendfile
+SENDFILE_MIN_SIZE = 64 * 1024
+
+# The build output doesn't change while the server runs, so stat it once
+FRONTEND_EXISTS = FRONTEND_DIR.exists()
+STATIC_FILES: dict[str, Path] = {
+    path.relative_to(FRONTEND_DIR).as_posix(): path
+    for path in FRONTEND_DIR.rglob("*")
+    if path.is_file()
+} if FRONTEND_EXISTS else {}
+
+CachedFile = tuple[bytes, str, dict[str, str]]
+
+
+def _cache_file(path: Path, cache_control: str) -> CachedFile:
+    """Read a build file into memory as (body, media type, response headers)"""
+    data = path.read_bytes()
+    return (
+        data,
+        mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        {
+            "ETag": f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"',
+            "Last-Modified": formatdate(path.stat().st_mtime, usegmt=True),
+            "Cache-Control": cache_control,
+        },
+    )
+
+
+# Media types worth compressing ahead of time
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+
+def _precompress(cached: CachedFile) -> dict[str, CachedFile]:
+    """
+    Build the content-coded variants of a cached build file.
+
+    Returns:
+        Map of content coding ("identity", "gzip", "br") to cached file; a
+        coding is only included when it actually shrinks the body
+    """
+    data, media_type, headers = cached
+    if not media_type.startswith(COMPRESSIBLE_TYPES):
+        return {"identity": cached}
+
+    encoders = {"gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders["br"] = lambda body: brotli.compress(body, quality=11)
+
+    variants = {"identity": cached}
+    for encoding, compress in encoders.items():
+        body = compress(data)
+        if len(body) < len(data):
+            variants[encoding] = (body, media_type, {
+                **headers,
+                "Vary": "Accept-Encoding",
+                # Each coding is a distinct representation, so it needs its own ETag
+                "ETag": f'{headers["ETag"][:-1]}-{encoding}"',
+                "Content-Encoding": encoding,
+            })
+    if len(variants) > 1:
+        # The identity copy is one of several representations of this URL, so
+        # shared caches must key it on Accept-Encoding too
+        variants["identity"] = (data, media_type, {**headers, "Vary": "Accept-Encoding"})
+    return variants
+
+
+# Preferred content codings for precompressed assets, best first
+ASSET_ENCODINGS = ("br", "gzip")
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def _negotiate_encoding(accept_encoding: str, available: dict[str, CachedFile]) -> str:
+    """Pick the best precompressed coding the client accepts with q > 0, else identity"""
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ASSET_ENCODINGS:
+        if encoding in available and accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return "identity"
+
+
+# The hashed bundle is small and never changes while running, so serve it from
+# memory, compressed once up front instead of by GZipMiddleware on every hit
+ASSET_CACHE: dict[str, dict[str, CachedFile]] = {
+    rel_path.removeprefix("assets/"): _precompress(_cache_file(path, IMMUTABLE_CACHE_CONTROL))
+    for rel_path, path in STATIC_FILES.items()
+    if rel_path.startswith("assets/")
+}
+
+# index.html plus small root-level files; larger ones are streamed from disk
+INLINE_FILES: dict[str, CachedFile] = {
+    rel_path: _cache_file(path, "no-cache" if rel_path == "index.html" else STATIC_CACHE_CONTROL)
+    for rel_path, path in STATIC_FILES.items()
+    if not rel_path.startswith("assets/")
+    and (rel_path == "index.html" or path.stat().st_size <= SENDFILE_MIN_SIZE)
+}
+INDEX_HTML = INLINE_FILES.get("index.html")
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """
+    Evaluate the request's conditional headers against a static file.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when no ETag was sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return any(
+            tag.strip().removeprefix("W/") in (etag, "*")
+            for tag in if_none_match.split(",")
+        )
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        since = parsedate(if_modified_since)
+        return since is not None and since >= parsedate(last_modified)
+    return False
+
+
+def _cached_file_response(request: Request, cached: CachedFile) -> Response:
+    """Serve an in-memory build file, answering 304 when the client's copy is current"""
+    data, media_type, headers = cached
+    if _is_not_modified(request, headers["ETag"], headers["Last-Modified"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type=media_type, headers=headers)
+
+
+def _disk_file_response(request: Request, path: Path) -> Response:
+    """Stream a build file from disk (sendfile), answering 304 when the client's copy is current"""
+    response = FileResponse(path, stat_result=path.stat())
+    headers = response.headers
+    if _is_not_modified(request, headers["etag"], headers["last-modified"]):
+        return Response(
+            status_code=304,
+            headers={"ETag": headers["etag"], "Last-Modified": headers["last-modified"]},
+        )
+    return response
+
+
 # Application version
 APP_VERSION = "0.4.0"
 
+# Process start on the monotonic clock, for /health uptime
+START_MONOTONIC = time.monotonic()
+
 # Environment detection
 IS_PRODUCTION = os.getenv("NODE_ENV") == "production"
 
@@ -80,6 +273,18 @@ if RALPH_URL:
     else:
         CORS_ORIGINS.append(RALPH_URL)
 
+# Freeze origin config - nothing may mutate it once the app is built
+CORS_ORIGINS = tuple(CORS_ORIGINS)
+
+# Immutable allowlist for O(1) origin lookups. Both CORSMiddleware (which checks
+# `origin in allow_origins`) and CORSPreflightMiddleware get this frozenset, so an
+# origin check is one hash lookup - cheaper than an allow_origin_regex fullmatch
+ALLOWED_ORIGINS: frozenset[str] = frozenset(CORS_ORIGINS)
+
+CORS_ALLOW_METHODS = ("GET", "POST", "OPTIONS")
+CORS_ALLOW_HEADERS = ("Content-Type", "Authorization", "X-Requested-With", "X-Ralph-Signature")
+CORS_MAX_AGE = 86400  # Cache preflight for 24 hours
+
 # In production without explicit origins, log a warning
 # NOTE: Configure PRODUCTION_ORIGIN environment variable for proper CORS in production
 if IS_PRODUCTION and not PRODUCTION_ORIGIN:
@@ -91,50 +296,180 @@ if IS_PRODUCTION and not PRODUCTION_ORIGIN:
 # Security Middleware
 # ============================================================================
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses"""
+# Static security headers, pre-encoded once for every response.
+# X-XSS-Protection is deliberately omitted: modern browsers ignore it and CSP covers it.
+SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", (
+        b"default-src 'self'; "
+        b"script-src 'self' 'unsafe-inline'; "
+        b"style-src 'self' 'unsafe-inline'; "
+        b"img-src 'self' data: https:; "
+        b"connect-src 'self' https://services.swpc.noaa.gov https://maps.googleapis.com; "
+        b"font-src 'self' data:; "
+        b"frame-ancestors 'none'"
+    )),
+]
+
+# Paths that bypass the custom middleware layers entirely
+SKIP_MIDDLEWARE_PREFIXES = ("/health", "/assets/", "/vite.svg")
+
+# Probes only need the JSON body; static files still get nosniff/CSP and cache headers
+SKIP_SECURITY_HEADERS_PREFIXES = ("/health",)
+
+
+class SecurityHeadersMiddleware:
+    """
+    Add security headers to all responses.
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "connect-src 'self' https://services.swpc.noaa.gov https://maps.googleapis.com; "
-            "font-src 'self' data:; "
-            "frame-ancestors 'none'"
-        )
+    Pure ASGI: headers are appended to the http.response.start message, so
+    responses aren't re-buffered through BaseHTTPMiddleware's call_next.
+    """
 
-        # Cache control for API responses
-        if request.url.path.startswith("/api"):
-            # Don't cache API responses by default
-            if "Cache-Control" not in response.headers:
-                response.headers["Cache-Control"] = "no-store, max-age=0"
+    def __init__(self, app):
+        self.app = app
 
-        return response
+    async def __call__(self, scope, receive, send):
+        # Health probes only need the JSON body
+        if scope["type"] != "http" or scope["path"].startswith(SKIP_SECURITY_HEADERS_PREFIXES):
+            await self.app(scope, receive, send)
+            return
 
+        is_options = scope["method"] == "OPTIONS"
+        is_api = scope["state"]["is_api"]
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                # Copy rather than extend: the list may belong to a reused Response
+                message["headers"] = raw_headers = [*message.get("headers", ()), *SECURITY_HEADERS]
+                headers = MutableHeaders(raw=raw_headers)
+                status = message["status"]
+
+                if is_options:
+                    # Let browsers and CDNs cache successful CORS preflights
+                    if 200 <= status < 300:
+                        headers["Cache-Control"] = "public, max-age=86400"
+                        headers["Vary"] = "Origin, Access-Control-Request-Headers, Access-Control-Request-Method"
+                elif is_api:
+                    # Don't cache API responses by default
+                    headers.setdefault("Cache-Control", "no-store, max-age=0")
+                elif status == 200:
+                    static_path = scope["path"].lstrip("/")
+                    if static_path.startswith("assets/") and static_path in STATIC_FILES:
+                        # Vite emits content-hashed filenames, so these never change
+                        headers.setdefault("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+                    elif static_path in STATIC_FILES and static_path != "index.html":
+                        headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+                    else:
+                        # SPA entry point - always revalidate so new deploys are picked up
+                        headers.setdefault("Cache-Control", "no-cache")
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class PathClassifierMiddleware:
+    """
+    Classify the request path once and store the result in request.state.
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory rate limiter per client IP.
+    Sets request.state.is_api so later middleware and handlers don't
+    repeat the prefix check.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["is_api"] = scope["path"].startswith("/api")
+        await self.app(scope, receive, send)
+
+
+class CORSPreflightMiddleware:
+    """
+    Answer CORS preflights from allowed origins before any other middleware runs.
+
+    Preflights from unknown origins, or for methods we don't allow, fall
+    through to CORSMiddleware so it can produce its usual rejection.
+    """
+
+    _PREFLIGHT_HEADERS = [
+        (b"access-control-allow-methods", ", ".join(CORS_ALLOW_METHODS).encode()),
+        (b"access-control-allow-headers", ", ".join(CORS_ALLOW_HEADERS).encode()),
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-max-age", str(CORS_MAX_AGE).encode()),
+        (b"cache-control", f"public, max-age={CORS_MAX_AGE}".encode()),
+        (b"vary", b"Origin, Access-Control-Request-Headers, Access-Control-Request-Method"),
+    ]
+    _ALLOWED_METHODS = frozenset(m.encode() for m in CORS_ALLOW_METHODS)
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+
+        if (
+            origin is None
+            or request_method not in self._ALLOWED_METHODS
+            or origin.decode("latin-1") not in ALLOWED_ORIGINS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 204,
+            "headers": [(b"access-control-allow-origin", origin), *self._PREFLIGHT_HEADERS],
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+
+@dataclass(slots=True)
+class _ClientRateState:
+    """Per-client rate limit state: a token bucket plus a 60-second sliding window."""
+    tokens: float
+    last_refill: float
+    window: array  # request counts per second, indexed by second % 60
+    last_second: int
+    window_count: int = 0
 
-    Uses X-Forwarded-For when behind a reverse proxy, with periodic
-    cleanup of stale entries to prevent memory leaks.
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """Per client IP rate limiter combining a token bucket and a sliding window.
+
+    Uses X-Forwarded-For when behind a reverse proxy. Each IP holds a token
+    bucket refilled at requests_per_minute / 60 tokens per second up to
+    `burst` (default: requests_per_minute, so a client may spend its whole
+    minute's allowance at once, as before; pass a smaller value to smooth
+    short bursts), plus a fixed 60-slot ring of
+    per-second counts that caps requests in any rolling minute at
+    `requests_per_minute`. Both checks are O(1) with no per-request
+    allocation. State lives in an LRU-ordered dict capped at `max_clients`
+    entries, so memory stays constant.
     """
 
-    def __init__(self, app, requests_per_minute: int = 60, burst: int = 10):
+    WINDOW_SECONDS = 60
+
+    def __init__(self, app, requests_per_minute: int = 60, burst: Optional[int] = None, max_clients: int = 10000):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.burst = burst
-        self._requests: dict[str, list[float]] = defaultdict(list)
-        self._last_cleanup = time.monotonic()
-        self._cleanup_interval = 300.0  # Clean up stale IPs every 5 minutes
+        self.burst = requests_per_minute if burst is None else burst
+        self.max_clients = max_clients
+        self._refill_rate = requests_per_minute / 60.0  # tokens per second
+        self._clients: OrderedDict[str, _ClientRateState] = OrderedDict()
 
     def _get_client_ip(self, request: Request) -> str:
         """Extract real client IP, considering reverse proxy headers."""
@@ -147,37 +482,81 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return x_real_ip.strip()
         return request.client.host if request.client else "unknown"
 
-    def _cleanup_stale_entries(self, now: float) -> None:
-        """Remove entries for IPs that haven't sent requests recently."""
-        if now - self._last_cleanup < self._cleanup_interval:
+    def _advance_window(self, state: _ClientRateState, second: int) -> None:
+        """Expire ring slots for the seconds elapsed since the last request."""
+        elapsed = second - state.last_second
+        if elapsed <= 0:
             return
-        self._last_cleanup = now
-        stale_ips = [
-            ip for ip, timestamps in self._requests.items()
-            if not timestamps or now - timestamps[-1] > 120.0
-        ]
-        for ip in stale_ips:
-            del self._requests[ip]
+        window = state.window
+        if elapsed >= self.WINDOW_SECONDS:
+            for i in range(self.WINDOW_SECONDS):
+                window[i] = 0
+            state.window_count = 0
+        else:
+            for s in range(state.last_second + 1, second + 1):
+                slot = s % self.WINDOW_SECONDS
+                state.window_count -= window[slot]
+                window[slot] = 0
+        state.last_second = second
+
+    def _window_retry_after(self, state: _ClientRateState, second: int) -> int:
+        """Seconds until the oldest request in the window expires."""
+        window = state.window
+        for offset in range(1, self.WINDOW_SECONDS + 1):
+            if window[(second + offset) % self.WINDOW_SECONDS]:
+                return offset
+        return self.WINDOW_SECONDS
+
+    def _check_rate(self, client_ip: str, now: float) -> float:
+        """
+        Record a request for client_ip if it is within limits.
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until it would be
+        """
+        second = int(now)
+        state = self._clients.pop(client_ip, None)
+        if state is None:
+            state = _ClientRateState(
+                tokens=float(self.burst),
+                last_refill=now,
+                window=array("I", bytes(4 * self.WINDOW_SECONDS)),
+                last_second=second,
+            )
+        else:
+            state.tokens = min(self.burst, state.tokens + (now - state.last_refill) * self._refill_rate)
+            state.last_refill = now
+            self._advance_window(state, second)
+
+        self._clients[client_ip] = state
+        if len(self._clients) > self.max_clients:
+            # Evict the least recently seen client
+            self._clients.popitem(last=False)
+
+        if state.tokens < 1.0:
+            return (1.0 - state.tokens) / self._refill_rate
+        if state.window_count >= self.requests_per_minute:
+            return self._window_retry_after(state, second)
+
+        state.tokens -= 1.0
+        state.window[second % self.WINDOW_SECONDS] += 1
+        state.window_count += 1
+        return 0.0
+
+    async def __call__(self, scope, receive, send):
+        # Skip rate limiting for health checks and static files without
+        # entering the dispatch/call_next machinery
+        if scope["type"] == "http" and (
+            scope["path"].startswith(SKIP_MIDDLEWARE_PREFIXES) or not scope["state"]["is_api"]
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
     async def dispatch(self, request: Request, call_next):
-        # Skip rate limiting for health checks and static files
-        if not request.url.path.startswith("/api"):
-            return await call_next(request)
-
-        client_ip = self._get_client_ip(request)
-        now = time.monotonic()
-        window = 60.0  # 1 minute window
-
-        # Periodically clean up stale IP entries to prevent memory leak
-        self._cleanup_stale_entries(now)
-
-        # Clean old entries for this IP
-        self._requests[client_ip] = [
-            t for t in self._requests[client_ip] if now - t < window
-        ]
-
-        if len(self._requests[client_ip]) >= self.requests_per_minute:
-            return JSONResponse(
+        retry_after = self._check_rate(self._get_client_ip(request), time.monotonic())
+        if retry_after:
+            return ORJSONResponse(
                 status_code=429,
                 content={
                     "success": False,
@@ -186,10 +565,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                         "message": "Too many requests. Please try again later.",
                     },
                 },
-                headers={"Retry-After": "60"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
             )
 
-        self._requests[client_ip].append(now)
         return await call_next(request)
 
 
@@ -197,40 +575,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 # Application Lifespan (Startup & Shutdown)
 # ============================================================================
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+async def _deferred_init(app: FastAPI):
     """
-    Application lifespan handler.
+    Startup work that talks to external services.
 
-    Startup:
-    - Initialize logging
-    - Send startup event to Ralph
-    - Register with Ralph for bidirectional communication
-
-    Shutdown:
-    - Send shutdown event to Ralph
+    Runs in the background after the server starts accepting connections so
+    slow Ralph round-trips don't delay port binding. Sets app.state.ready
+    once complete.
     """
-    # ==================== STARTUP ====================
-    logger.info(f"HelioMetric v{APP_VERSION} starting...")
-    logger.info(f"Environment: {'production' if IS_PRODUCTION else 'development'}")
-    logger.info(f"Frontend directory: {FRONTEND_DIR}")
-    logger.info(f"Frontend exists: {FRONTEND_DIR.exists()}")
-
-    # Setup Ralph logging handler
-    setup_ralph_logging()
-
-    # Log Ralph configuration status
-    ralph_config = ralph_monitor.get_config_status()
-    logger.info(f"Ralph monitoring config: {ralph_config}")
-
     # Send startup event to Ralph
     if ralph_monitor.is_configured():
         try:
-            startup_result = ralph_monitor.startup(version=APP_VERSION)
+            startup_result = await asyncio.to_thread(ralph_monitor.startup, version=APP_VERSION)
             logger.info(f"Ralph startup event: {startup_result.get('status', 'unknown')}")
 
             # Register for bidirectional communication
-            register_result = ralph_monitor.register_with_ralph(
+            register_result = await asyncio.to_thread(
+                ralph_monitor.register_with_ralph,
                 name="HelioMetric",
                 capabilities=[
                     "health_check",
@@ -257,15 +618,78 @@ async def lifespan(app: FastAPI):
     task_scheduler.start()
     logger.info("Research task scheduler started")
 
+    app.state.ready = True
+    logger.info("HelioMetric ready")
+
+
+async def _warm_db_pool():
+    """
+    Pre-warm the database connection pool in the background.
+
+    Kept off the readiness path: no route depends on the database yet, so a
+    slow or unreachable database must not hold up the scheduler or ready.
+    """
+    try:
+        warmed = await warm_pool()
+        if warmed:
+            logger.info(f"Database pool warmed with {warmed} connections")
+    except Exception as e:
+        logger.warning(f"Failed to warm database pool: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+
+    Startup:
+    - Initialize logging
+    - Open the shared upstream HTTP client
+    - Schedule deferred init (Ralph startup/registration, task scheduler)
+      and database pool warm-up in the background
+
+    Shutdown:
+    - Close the shared upstream HTTP client
+    - Send shutdown event to Ralph
+    """
+    # ==================== STARTUP ====================
+    logger.info(f"HelioMetric v{APP_VERSION} starting...")
+    logger.info(f"Environment: {'production' if IS_PRODUCTION else 'development'}")
+    logger.info(f"Frontend directory: {FRONTEND_DIR}")
+    logger.info(f"Frontend exists: {FRONTEND_EXISTS} ({len(STATIC_FILES)} files)")
+
+    # Setup Ralph logging handler
+    setup_ralph_logging()
+
+    # Log Ralph configuration status
+    ralph_config = ralph_monitor.get_config_status()
+    logger.info(f"Ralph monitoring config: {ralph_config}")
+
+    # Open the shared upstream HTTP client before the first request needs it
+    get_http_client()
+
+    # Defer external-service startup work so the port binds immediately
+    app.state.ready = False
+    init_task = asyncio.create_task(_deferred_init(app))
+    warm_task = asyncio.create_task(_warm_db_pool())
+
     yield
 
     # ==================== SHUTDOWN ====================
     logger.info("HelioMetric shutting down...")
 
+    # Cancel deferred init and pool warm-up if they are still running
+    for task in (init_task, warm_task):
+        if not task.done():
+            task.cancel()
+
     # Stop the task scheduler
     task_scheduler.stop()
     logger.info("Research task scheduler stopped")
 
+    # Release pooled upstream connections
+    await close_http_client()
+
     # Send shutdown event to Ralph
     if ralph_monitor.is_configured():
         try:
@@ -286,6 +710,7 @@ app = FastAPI(
     description="Heliospheric Resonance Dashboard - Space weather and geomagnetic analysis API",
     version=APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json"
@@ -296,26 +721,35 @@ app.add_middleware(
     RalphErrorMiddleware,
     report_5xx=True,
     slow_request_threshold_ms=5000,
-    exclude_paths=["/health", "/api/ralph-callback"]
+    exclude_paths=[*SKIP_MIDDLEWARE_PREFIXES, "/api/ralph-callback"]
 )
 
 # Add rate limiting middleware
 app.add_middleware(RateLimitMiddleware, requests_per_minute=60)
 
-# Add security headers middleware
-app.add_middleware(SecurityHeadersMiddleware)
-
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-Ralph-Signature"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
     expose_headers=["X-Request-ID"],
-    max_age=86400,  # Cache preflight for 24 hours
+    max_age=CORS_MAX_AGE,
 )
 
+# Add security headers middleware (wraps CORS, so it also sees rejected preflights)
+app.add_middleware(SecurityHeadersMiddleware)
+
+# Compress responses (outside SecurityHeadersMiddleware, so headers are already set)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+# Classify the request path for everything below
+app.add_middleware(PathClassifierMiddleware)
+
+# Short-circuit allowed CORS preflights (outermost - skips all other middleware)
+app.add_middleware(CORSPreflightMiddleware)
+
 # Include API routers
 app.include_router(noaa.router, prefix="/api", tags=["NOAA"])
 app.include_router(location.router, prefix="/api", tags=["Location"])
@@ -328,6 +762,18 @@ app.include_router(research_router, tags=["Research Agent"])
 # Health & Info Endpoints
 # ============================================================================
 
+# Static part of the /health payload (dual-case keys); only uptime changes
+HEALTH_DATA = add_camel_case_aliases({
+    "status": "healthy",
+    "service": "HelioMetric",
+    "version": APP_VERSION,
+    "environment": "production" if IS_PRODUCTION else "development",
+})
+
+# Pre-serialized /health body; only uptime and the meta block are spliced in per request
+_HEALTH_BODY_HEAD = b'{"success":true,"data":' + orjson.dumps(HEALTH_DATA)[:-1] + b',"uptime_seconds":'
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -337,18 +783,128 @@ async def health_check():
     Used by deployment platforms for health monitoring.
     Ralph Agent checks this endpoint every 6 hours.
     """
-    return success_response(
-        data={
-            "status": "healthy",
-            "service": "HelioMetric",
-            "version": APP_VERSION,
-            "environment": "production" if IS_PRODUCTION else "development",
-            "uptime_seconds": ralph_monitor.get_uptime_seconds(),
-        },
-        source="system"
+    uptime = str(int(time.monotonic() - START_MONOTONIC)).encode()
+    return Response(
+        b"".join((
+            _HEALTH_BODY_HEAD, uptime, b',"uptimeSeconds":', uptime,
+            b'},"meta":', orjson.dumps(response_meta(source="system")), b"}",
+        )),
+        media_type="application/json",
     )
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - returns 200 whenever the process is serving requests."""
+    return ORJSONResponse(success_response(data={"status": "alive"}, source="system"))
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe - returns 503 until deferred startup work has completed."""
+    if not getattr(app.state, "ready", False):
+        return ORJSONResponse(
+            status_code=503,
+            content=error_response(
+                code=ErrorCodes.SERVICE_UNAVAILABLE,
+                message="Service is starting up",
+                status_code=503
+            )
+        )
+    return ORJSONResponse(success_response(data={"status": "ready"}, source="system"))
+
+
+# The /api payload only depends on import-time configuration, so build
+# (and camelCase-alias) it once
+API_INFO_DATA = add_camel_case_aliases({
+    "name": "HelioMetric API",
+    "version": APP_VERSION,
+    "description": "Space weather and geomagnetic analysis API",
+    "response_format": {
+        "note": "All responses include both snake_case and camelCase field names",
+        "structure": {
+            "success": "boolean",
+            "data": "response payload",
+            "meta": "metadata (timestamp, cached, source)",
+            "error": "error details (when success=false)"
+        }
+    },
+    "endpoints": [
+        {
+            "path": "/api/noaa",
+            "method": "GET",
+            "description": "Get NOAA K-Index space weather data"
+        },
+        {
+            "path": "/api/noaa/description/{kp_value}",
+            "method": "GET",
+            "description": "Get description for specific K-Index value"
+        },
+        {
+            "path": "/api/location",
+            "method": "POST",
+            "description": "Analyze geomagnetic impact for coordinates"
+        },
+        {
+            "path": "/api/location/bulk",
+            "method": "POST",
+            "description": "Geomagnetic analysis for up to 1000 coordinates"
+        },
+        {
+            "path": "/api/geocode",
+            "method": "POST",
+            "description": "Convert address to coordinates"
+        },
+        {
+            "path": "/api/ralph-callback",
+            "method": "POST",
+            "description": "Ralph Agent monitoring callback"
+        },
+        {
+            "path": "/api/research/discuss",
+            "method": "POST",
+            "description": "Free-form discussion with research agent"
+        },
+        {
+            "path": "/api/research/skill",
+            "method": "POST",
+            "description": "Execute a specific research skill"
+        },
+        {
+            "path": "/api/research/tasks",
+            "method": "GET/POST",
+            "description": "Manage scheduled research tasks"
+        },
+        {
+            "path": "/health",
+            "method": "GET",
+            "description": "Service health check"
+        },
+        {
+            "path": "/health/live",
+            "method": "GET",
+            "description": "Liveness probe"
+        },
+        {
+            "path": "/health/ready",
+            "method": "GET",
+            "description": "Readiness probe (503 until startup completes)"
+        },
+    ],
+    "monitoring": {
+        "ralph_configured": ralph_monitor.is_configured(),
+    },
+    "documentation": {
+        "swagger": "/api/docs",
+        "redoc": "/api/redoc",
+        "openapi": "/api/openapi.json"
+    }
+})
+
+# Pre-serialized /api body; only the meta block is appended per request
+_API_INFO_BODY_HEAD = b'{"success":true,"data":' + orjson.dumps(API_INFO_DATA) + b',"meta":'
+
+
 @app.get("/api")
 async def api_info():
     """
@@ -357,137 +913,82 @@ async def api_info():
     Returns a list of available endpoints with descriptions
     and links to API documentation.
     """
-    return success_response(
-        data={
-            "name": "HelioMetric API",
-            "version": APP_VERSION,
-            "description": "Space weather and geomagnetic analysis API",
-            "response_format": {
-                "note": "All responses include both snake_case and camelCase field names",
-                "structure": {
-                    "success": "boolean",
-                    "data": "response payload",
-                    "meta": "metadata (timestamp, cached, source)",
-                    "error": "error details (when success=false)"
-                }
-            },
-            "endpoints": [
-                {
-                    "path": "/api/noaa",
-                    "method": "GET",
-                    "description": "Get NOAA K-Index space weather data"
-                },
-                {
-                    "path": "/api/noaa/description/{kp_value}",
-                    "method": "GET",
-                    "description": "Get description for specific K-Index value"
-                },
-                {
-                    "path": "/api/location",
-                    "method": "POST",
-                    "description": "Analyze geomagnetic impact for coordinates"
-                },
-                {
-                    "path": "/api/geocode",
-                    "method": "POST",
-                    "description": "Convert address to coordinates"
-                },
-                {
-                    "path": "/api/ralph-callback",
-                    "method": "POST",
-                    "description": "Ralph Agent monitoring callback"
-                },
-                {
-                    "path": "/api/research/discuss",
-                    "method": "POST",
-                    "description": "Free-form discussion with research agent"
-                },
-                {
-                    "path": "/api/research/skill",
-                    "method": "POST",
-                    "description": "Execute a specific research skill"
-                },
-                {
-                    "path": "/api/research/tasks",
-                    "method": "GET/POST",
-                    "description": "Manage scheduled research tasks"
-                },
-                {
-                    "path": "/health",
-                    "method": "GET",
-                    "description": "Service health check"
-                },
-            ],
-            "monitoring": {
-                "ralph_configured": ralph_monitor.is_configured(),
-            },
-            "documentation": {
-                "swagger": "/api/docs",
-                "redoc": "/api/redoc",
-                "openapi": "/api/openapi.json"
-            }
-        },
-        source="documentation"
+    return Response(
+        b"".join((_API_INFO_BODY_HEAD, orjson.dumps(response_meta(source="documentation")), b"}")),
+        media_type="application/json",
     )
 
 
-# Mount static files if frontend is built
-if FRONTEND_DIR.exists():
-    # Serve static assets (js, css, images, etc.)
-    app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="assets")
+# Serve static assets (js, css, images, etc.) if frontend is built
+if FRONTEND_EXISTS:
+    @app.get("/assets/{asset_path:path}", include_in_schema=False)
+    async def serve_asset(request: Request, asset_path: str):
+        """Serve a Vite build asset from the in-memory cache"""
+        variants = ASSET_CACHE.get(asset_path)
+        if variants is None:
+            raise HTTPException(status_code=404)
+        encoding = _negotiate_encoding(request.headers.get("accept-encoding", ""), variants)
+        return _cached_file_response(request, variants[encoding])
 
     # Serve other static files from root
     @app.get("/vite.svg")
-    async def vite_svg():
-        return FileResponse(FRONTEND_DIR / "vite.svg")
+    async def vite_svg(request: Request):
+        cached = INLINE_FILES.get("vite.svg")
+        if cached is None:
+            return _disk_file_response(request, FRONTEND_DIR / "vite.svg")
+        return _cached_file_response(request, cached)
+
+# The SPA entry point is the hottest URL, so route it directly rather than
+# through the {full_path:path} catch-all
+if INDEX_HTML is not None:
+    @app.get("/", include_in_schema=False)
+    @app.get("/index.html", include_in_schema=False)
+    async def serve_index(request: Request):
+        """Serve index.html from the in-memory cache"""
+        return _cached_file_response(request, INDEX_HTML)
+
+if "favicon.ico" in INLINE_FILES:
+    @app.get("/favicon.ico", include_in_schema=False)
+    async def favicon(request: Request):
+        return _cached_file_response(request, INLINE_FILES["favicon.ico"])
 
 
 # ============================================================================
 # Error Handlers
 # ============================================================================
 
+_NOT_FOUND = ErrorTemplate(ErrorCodes.NOT_FOUND, "Resource not found", status_code=404)
+
+
+def _not_found_response(message: Optional[str] = None) -> Response:
+    """Build a standardized 404 error response from the pre-serialized envelope"""
+    return _NOT_FOUND.response(message)
+
+
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """Handle 404 errors with standardized response"""
-    if request.url.path.startswith("/api"):
-        return JSONResponse(
-            status_code=404,
-            content=error_response(
-                code=ErrorCodes.NOT_FOUND,
-                message=f"Endpoint not found: {request.url.path}",
-                status_code=404
-            )
-        )
+    if request.state.is_api:
+        return _not_found_response(f"Endpoint not found: {request.url.path}")
     # For non-API routes, let SPA handle it
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    return JSONResponse(
-        status_code=404,
-        content=error_response(
-            code=ErrorCodes.NOT_FOUND,
-            message="Resource not found",
-            status_code=404
-        )
-    )
+    if INDEX_HTML is not None:
+        return _cached_file_response(request, INDEX_HTML)
+    return _not_found_response()
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc):
     """Handle 500 errors with standardized response"""
-    # Report to Ralph
+    # Report to Ralph in the background so the response isn't held up
     if ralph_monitor.is_configured():
-        try:
-            ralph_monitor.error(
-                title="HTTP 500 Error",
-                message=f"{request.method} {request.url.path}",
-                severity="critical",
-                exception=str(exc)
-            )
-        except Exception:
-            pass  # Don't let Ralph errors affect the response
-
-    return JSONResponse(
+        ralph_monitor.report_in_background(ralph_monitor.error_async(
+            title="HTTP 500 Error",
+            message=f"{request.method} {request.url.path}",
+            severity="critical",
+            exception=str(exc)
+        ))
+
+    return ORJSONResponse(
         status_code=500,
         content=error_response(
             code=ErrorCodes.INTERNAL_ERROR,
@@ -505,41 +1006,28 @@ async def internal_error_handler(request: Request, exc):
 async def serve_spa(request: Request, full_path: str):
     """Serve the React SPA for all non-API routes"""
     # Don't serve index.html for API routes
-    if full_path.startswith("api"):
-        return JSONResponse(
-            status_code=404,
-            content=error_response(
-                code=ErrorCodes.NOT_FOUND,
-                message=f"API endpoint not found: /api/{full_path.replace('api/', '')}",
-                status_code=404
-            )
-        )
-
-    # Check if it's a static file that exists (with path traversal protection)
-    try:
-        file_path = (FRONTEND_DIR / full_path).resolve()
-        # Ensure the resolved path is still within FRONTEND_DIR
-        file_path.relative_to(FRONTEND_DIR.resolve())
-    except (ValueError, OSError):
-        # Path traversal attempt or invalid path
-        return JSONResponse(
-            status_code=404,
-            content=error_response(
-                code=ErrorCodes.NOT_FOUND,
-                message="Resource not found",
-                status_code=404
-            )
-        )
-    if file_path.exists() and file_path.is_file():
-        return FileResponse(file_path)
+    if request.state.is_api:
+        return _not_found_response(f"API endpoint not found: /api/{full_path.replace('api/', '')}")
+
+    # Serve known build files directly (no filesystem lookups)
+    cached = INLINE_FILES.get(full_path)
+    if cached is not None:
+        return _cached_file_response(request, cached)
+    static_file = STATIC_FILES.get(full_path)
+    if static_file is not None:
+        return _disk_file_response(request, static_file)
+
+    # Files are only ever served from the STATIC_FILES lookups above, so the
+    # filesystem is never touched here; still reject traversal attempts outright
+    if ".." in full_path.split("/"):
+        return _not_found_response()
 
     # Serve index.html for all other routes (SPA routing)
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if INDEX_HTML is not None:
+        return _cached_file_response(request, INDEX_HTML)
 
     # Fallback if frontend not built
-    return success_response(
+    return ORJSONResponse(success_response(
         data={
             "status": "healthy",
             "service": "HelioMetric API",
@@ -548,7 +1036,7 @@ async def serve_spa(request: Request, full_path: str):
             "api_docs": "/api/docs"
         },
         source="system"
-    )
+    ))
 
 
 if __name__ == "__main__":
@@ -558,5 +1046,5 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=os.getenv("NODE_ENV") != "production"
+        reload=not IS_PRODUCTION
     )
@@ -6,20 +6,62 @@ This middleware intercepts unhandled exceptions and server errors,
 sending them to Ralph for centralized monitoring.
 """
 
+import time
 import logging
 import traceback
-import asyncio
-from typing import Callable
+from collections import deque
 from datetime import datetime, timezone
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import orjson
+from fastapi import Request
+from starlette.responses import Response
+
+from services import ralph_monitor
 
 logger = logging.getLogger(__name__)
 
+# Innermost frames to include in traceback reports
+TRACEBACK_FRAME_LIMIT = 15
+
+# Generic 500 body, pre-serialized; only the timestamp is spliced in
+_INTERNAL_ERROR_HEAD, _INTERNAL_ERROR_TAIL = orjson.dumps({
+    "success": False,
+    "error": {
+        "code": "INTERNAL_ERROR",
+        "message": "Internal server error"
+    },
+    "meta": {
+        "timestamp": "__TIMESTAMP__"
+    }
+}).split(b'"__TIMESTAMP__"')
+
+# (epoch second, encoded ISO timestamp) - refreshed at most once per second
+_last_timestamp: tuple[int, bytes] = (0, b"")
+
+
+def _iso_now() -> bytes:
+    """Current UTC time as a JSON-encoded ISO 8601 string, cached per second."""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, orjson.dumps(
+            datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        ))
+    return _last_timestamp[1]
+
+
+def format_exception_tail(exc: BaseException, limit: int = TRACEBACK_FRAME_LIMIT) -> str:
+    """
+    Format only the innermost frames of an exception's traceback.
+
+    Avoids formatting the whole stack just to keep its tail: only the last
+    `limit` frames have their source lines looked up and formatted.
+    """
+    frames = traceback.StackSummary.extract(deque(traceback.walk_tb(exc.__traceback__), maxlen=limit))
+    return "".join(traceback.format_list(frames) + traceback.format_exception_only(type(exc), exc))
+
 
-class RalphErrorMiddleware(BaseHTTPMiddleware):
+class RalphErrorMiddleware:
     """
     Middleware that reports errors to Ralph Agent.
 
@@ -28,6 +70,9 @@ class RalphErrorMiddleware(BaseHTTPMiddleware):
     - HTTP 5xx responses
     - Slow requests (optional, if threshold configured)
 
+    Implemented as pure ASGI: the response status is read from the
+    http.response.start message instead of buffering through call_next.
+
     Usage:
         from middleware.ralph_error import RalphErrorMiddleware
         app.add_middleware(RalphErrorMiddleware)
@@ -49,66 +94,77 @@ class RalphErrorMiddleware(BaseHTTPMiddleware):
             slow_request_threshold_ms: Report requests slower than this (0 to disable)
             exclude_paths: List of paths to exclude from monitoring
         """
-        super().__init__(app)
+        self.app = app
         self.report_5xx = report_5xx
         self.slow_request_threshold_ms = slow_request_threshold_ms
+        # Compare raw perf_counter_ns deltas on the hot path
+        self.slow_request_threshold_ns = slow_request_threshold_ms * 1_000_000
         self.exclude_paths = exclude_paths or ["/health", "/api/ralph-callback"]
+        # str.startswith accepts a tuple and checks every prefix in C
+        self._exclude_prefixes = tuple(self.exclude_paths)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
         """Process the request and report errors to Ralph."""
         # Skip excluded paths
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            return await call_next(request)
-
-        start_time = datetime.now(timezone.utc)
-
-        try:
-            response = await call_next(request)
+        if scope["type"] != "http" or scope["path"].startswith(self._exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
 
-            # Calculate request duration
-            duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+        path = scope["path"]
+        status_code = 0
 
-            # Report 5xx errors
-            if self.report_5xx and response.status_code >= 500:
-                await self._report_http_error(request, response.status_code, duration_ms)
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            # Report slow requests
-            if self.slow_request_threshold_ms > 0 and duration_ms > self.slow_request_threshold_ms:
-                await self._report_slow_request(request, duration_ms)
-
-            return response
+        # Monotonic clock: wall-clock adjustments can't produce bogus durations
+        start_ns = time.perf_counter_ns()
 
+        try:
+            await self.app(scope, receive, send_with_status)
         except Exception as e:
             # Calculate duration even for exceptions
-            duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             # Report the exception
-            await self._report_exception(request, e, duration_ms)
+            await self._report_exception(Request(scope), path, e, duration_ms)
 
             # Re-raise to let FastAPI handle the response
             raise
 
+        # Calculate request duration
+        duration_ns = time.perf_counter_ns() - start_ns
+
+        # Report 5xx errors
+        if self.report_5xx and status_code >= 500:
+            await self._report_http_error(Request(scope), path, status_code, duration_ns / 1_000_000)
+
+        # Report slow requests
+        if self.slow_request_threshold_ns > 0 and duration_ns > self.slow_request_threshold_ns:
+            await self._report_slow_request(Request(scope), path, duration_ns / 1_000_000)
+
     async def _report_http_error(
         self,
         request: Request,
+        path: str,
         status_code: int,
         duration_ms: float
     ):
         """Report an HTTP 5xx error to Ralph."""
         try:
-            from services import ralph_monitor
-
             severity = "critical" if status_code >= 503 else "high"
 
             # Fire and forget - don't wait for response
-            asyncio.create_task(
+            ralph_monitor.report_in_background(
                 ralph_monitor.error_async(
                     title=f"HTTP {status_code} Error",
-                    message=f"{request.method} {request.url.path}",
+                    message=f"{request.method} {path}",
                     severity=severity,
                     status_code=status_code,
                     method=request.method,
-                    path=str(request.url.path),
+                    path=path,
                     query=str(request.url.query),
                     duration_ms=round(duration_ms, 2),
                     client_host=request.client.host if request.client else "unknown"
@@ -120,26 +176,24 @@ class RalphErrorMiddleware(BaseHTTPMiddleware):
     async def _report_exception(
         self,
         request: Request,
+        path: str,
         exception: Exception,
         duration_ms: float
     ):
         """Report an unhandled exception to Ralph."""
         try:
-            from services import ralph_monitor
-
             # Get truncated traceback
-            tb = traceback.format_exc()
-            truncated_tb = tb[-1000:] if len(tb) > 1000 else tb
+            truncated_tb = format_exception_tail(exception)[-1000:]
 
             # Fire and forget
-            asyncio.create_task(
+            ralph_monitor.report_in_background(
                 ralph_monitor.error_async(
                     title="Unhandled Exception",
                     message=str(exception)[:500],
                     severity="critical",
                     exception_type=type(exception).__name__,
                     method=request.method,
-                    path=str(request.url.path),
+                    path=path,
                     query=str(request.url.query),
                     duration_ms=round(duration_ms, 2),
                     traceback=truncated_tb,
@@ -152,19 +206,18 @@ class RalphErrorMiddleware(BaseHTTPMiddleware):
     async def _report_slow_request(
         self,
         request: Request,
+        path: str,
         duration_ms: float
     ):
         """Report a slow request to Ralph."""
         try:
-            from services import ralph_monitor
-
             # Fire and forget
-            asyncio.create_task(
+            ralph_monitor.report_in_background(
                 ralph_monitor.warning_async(
                     title="Slow Request",
-                    message=f"{request.method} {request.url.path} took {duration_ms:.0f}ms",
+                    message=f"{request.method} {path} took {duration_ms:.0f}ms",
                     method=request.method,
-                    path=str(request.url.path),
+                    path=path,
                     duration_ms=round(duration_ms, 2),
                     threshold_ms=self.slow_request_threshold_ms
                 )
@@ -184,8 +237,6 @@ def create_ralph_exception_handler():
     async def ralph_exception_handler(request: Request, exc: Exception):
         """Global exception handler that reports to Ralph."""
         try:
-            from services import ralph_monitor
-
             # Report the error
             await ralph_monitor.error_async(
                 title="Unhandled Exception",
@@ -193,24 +244,16 @@ def create_ralph_exception_handler():
                 severity="critical",
                 exception_type=type(exc).__name__,
                 path=str(request.url.path),
-                traceback=traceback.format_exc()[-1000:]
+                traceback=format_exception_tail(exc)[-1000:]
             )
         except Exception as e:
             logger.warning(f"Failed to report exception to Ralph: {e}")
 
         # Return a generic error response
-        return JSONResponse(
+        return Response(
+            _INTERNAL_ERROR_HEAD + _iso_now() + _INTERNAL_ERROR_TAIL,
             status_code=500,
-            content={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Internal server error"
-                },
-                "meta": {
-                    "timestamp": datetime.now(timezone.utc).isoformat() + "Z"
-                }
-            }
+            media_type="application/json"
         )
 
     return ralph_exception_handler
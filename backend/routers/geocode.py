@@ -6,19 +6,39 @@ Provides geocoding functionality using Google Maps API with Redis caching.
 Results are cached for 30 days to reduce API costs and improve response times.
 """
 
+import orjson
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel, Field, field_validator
 
-from services.maps import geocode_address, is_google_maps_configured
+from services.maps import GOOGLE_MAPS_CONFIGURED, geocode_address
 from utils.responses import (
-    success_response,
     error_response,
     ErrorCodes,
-    add_camel_case_aliases
+    ErrorTemplate,
+    response_meta,
+    add_camel_case_aliases,
+    ORJSONResponse
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Fixed failure responses, serialized once
+_NOT_CONFIGURED_ERROR = ErrorTemplate(
+    ErrorCodes.SERVICE_UNAVAILABLE,
+    "Geocoding service not available. Google Maps API key not configured.",
+    status_code=503
+)
+_INTERNAL_ERROR = ErrorTemplate(ErrorCodes.INTERNAL_ERROR, "Geocoding request failed", status_code=500)
+_RATE_LIMITED_ERROR = ErrorTemplate(
+    ErrorCodes.RATE_LIMITED,
+    "Geocoding is busy. Please try again shortly.",
+    status_code=429
+)
+
+# Envelope pieces around the pre-serialized location JSON
+_GEOCODE_BODY_HEAD = b'{"success":true,"data":{"location":'
+_GEOCODE_BODY_MID = b'},"meta":'
 
 
 # ============================================================================
@@ -70,23 +90,22 @@ async def geocode(request: GeocodeRequest):
     Errors:
         400: Invalid or missing address
         404: Address not found
+        429: Geocoding rate limit reached
         503: Geocoding service not configured
     """
     try:
         # Check if service is configured
-        if not is_google_maps_configured():
-            return JSONResponse(
-                status_code=503,
-                content=error_response(
-                    code=ErrorCodes.SERVICE_UNAVAILABLE,
-                    message="Geocoding service not available. Google Maps API key not configured.",
-                    status_code=503
-                )
-            )
+        if not GOOGLE_MAPS_CONFIGURED:
+            return _NOT_CONFIGURED_ERROR.response()
 
         # Perform geocoding
         result = await geocode_address(request.address)
 
+        if result.rate_limited:
+            response = _RATE_LIMITED_ERROR.response()
+            response.headers["Retry-After"] = "1"
+            return response
+
         if not result.success:
             # Determine appropriate error code
             error_code = ErrorCodes.NOT_FOUND
@@ -96,7 +115,7 @@ async def geocode(request: GeocodeRequest):
                 error_code = ErrorCodes.EXTERNAL_API_ERROR
                 status_code = 502
 
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status_code,
                 content=error_response(
                     code=error_code,
@@ -106,21 +125,17 @@ async def geocode(request: GeocodeRequest):
                 )
             )
 
-        # Build response with location data
-        location_data = None
-        if result.location:
-            location_data = add_camel_case_aliases(result.location.model_dump())
-
-        return success_response(
-            data={
-                "location": location_data,
-            },
-            cached=result.cached,
-            source="google_maps"
+        # Splice the cached location JSON into the envelope without re-encoding it
+        return Response(
+            b"".join((
+                _GEOCODE_BODY_HEAD, result.location_json or b"null", _GEOCODE_BODY_MID,
+                orjson.dumps(response_meta(cached=result.cached, source="google_maps")), b"}",
+            )),
+            media_type="application/json",
         )
 
     except ValueError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content=error_response(
                 code=ErrorCodes.VALIDATION_ERROR,
@@ -132,14 +147,36 @@ async def geocode(request: GeocodeRequest):
     except Exception as e:
         import logging
         logging.getLogger(__name__).error(f"Geocoding error: {e}", exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content=error_response(
-                code=ErrorCodes.INTERNAL_ERROR,
-                message="Geocoding request failed",
-                status_code=500,
-            )
-        )
+        return _INTERNAL_ERROR.response()
+
+
+# Maps availability is fixed at import, so the whole payload is static
+GEOCODE_INFO_DATA = add_camel_case_aliases({
+    "available": GOOGLE_MAPS_CONFIGURED,
+    "endpoint": "POST /api/geocode",
+    "method": "POST",
+    "body": {
+        "address": "string (required, 3-500 characters)"
+    },
+    "description": "Convert address to coordinates using Google Maps Geocoding API",
+    "caching": {
+        "enabled": True,
+        "ttl_days": 30,
+        "backend": "redis"
+    },
+    "response_fields": [
+        "lat",
+        "lng",
+        "formatted_address/formattedAddress",
+        "place_id/placeId",
+        "timezone (optional)",
+        "magnetic_declination/magneticDeclination (optional)"
+    ],
+    "status": "operational" if GOOGLE_MAPS_CONFIGURED else "unavailable"
+})
+
+# Pre-serialized body; only the meta block is appended per request
+_GEOCODE_INFO_BODY_HEAD = b'{"success":true,"data":' + orjson.dumps(GEOCODE_INFO_DATA) + b',"meta":'
 
 
 @router.get("/geocode")
@@ -150,31 +187,7 @@ async def geocode_info():
     Returns information about the geocoding endpoint
     and whether the service is currently available.
     """
-    is_available = is_google_maps_configured()
-
-    return success_response(
-        data={
-            "available": is_available,
-            "endpoint": "POST /api/geocode",
-            "method": "POST",
-            "body": {
-                "address": "string (required, 3-500 characters)"
-            },
-            "description": "Convert address to coordinates using Google Maps Geocoding API",
-            "caching": {
-                "enabled": True,
-                "ttl_days": 30,
-                "backend": "redis"
-            },
-            "response_fields": [
-                "lat",
-                "lng",
-                "formatted_address/formattedAddress",
-                "place_id/placeId",
-                "timezone (optional)",
-                "magnetic_declination/magneticDeclination (optional)"
-            ],
-            "status": "operational" if is_available else "unavailable"
-        },
-        source="documentation"
+    return Response(
+        b"".join((_GEOCODE_INFO_BODY_HEAD, orjson.dumps(response_meta(source="documentation")), b"}")),
+        media_type="application/json",
     )
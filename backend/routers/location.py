@@ -6,26 +6,41 @@ Provides geomagnetic latitude, magnetic declination, storm impact analysis,
 and optional timezone information for given coordinates.
 """
 
-from typing import Optional
+import asyncio
+from typing import Annotated, List, Optional
+
+import orjson
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, model_validator
 
 from services.maps import (
-    calculate_geomagnetic_latitude,
-    approximate_magnetic_declination,
-    get_storm_impact_factor,
-    get_timezone,
-    is_google_maps_configured
+    GOOGLE_MAPS_CONFIGURED,
+    analyze_geomagnetics,
+    analyze_geomagnetics_batch,
+    get_timezone
 )
 from utils.responses import (
     success_response,
     error_response,
     ErrorCodes,
-    CamelCaseModel
+    ErrorTemplate,
+    CamelCaseModel,
+    ORJSONResponse,
+    add_camel_case_aliases,
+    response_meta
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Fixed failure response, serialized once
+_INTERNAL_ERROR = ErrorTemplate(ErrorCodes.INTERNAL_ERROR, "Failed to analyze location", status_code=500)
+
+# Decimal places kept for computation and cache keys (4 = ~11 m)
+COORDINATE_PRECISION = 4
+
+# Maximum coordinates accepted by POST /location/bulk
+MAX_BULK_POINTS = 1000
 
 
 # ============================================================================
@@ -38,6 +53,28 @@ class LocationRequest(BaseModel):
     lng: float = Field(..., ge=-180, le=180, description="Longitude (-180 to 180)")
 
 
+class BulkLocationRequest(BaseModel):
+    """Bulk location analysis request body (parallel coordinate arrays)"""
+    lat: List[Annotated[float, Field(ge=-90, le=90)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_POINTS,
+        description="Latitudes (-90 to 90)"
+    )
+    lng: List[Annotated[float, Field(ge=-180, le=180)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_POINTS,
+        description="Longitudes (-180 to 180)"
+    )
+
+    @model_validator(mode="after")
+    def validate_lengths(self) -> "BulkLocationRequest":
+        if len(self.lat) != len(self.lng):
+            raise ValueError("lat and lng must have the same length")
+        return self
+
+
 class TimezoneInfo(CamelCaseModel):
     """Timezone information with dual-case field names"""
     id: str = Field(description="Timezone ID (e.g., 'America/New_York')")
@@ -96,48 +133,63 @@ async def analyze_location(request: LocationRequest):
         Standardized API response with location analysis data
     """
     try:
-        lat, lng = request.lat, request.lng
-
-        # Calculate geomagnetic properties
-        geomag_lat = calculate_geomagnetic_latitude(lat, lng)
-        declination = approximate_magnetic_declination(lat, lng)
-        storm_impact = get_storm_impact_factor(lat, lng)
-
-        # Build response data
+        # Round to ~11 m before any memoization or cache lookup so nearby
+        # requests share entries; the caller's values are echoed unchanged
+        lat = round(request.lat, COORDINATE_PRECISION)
+        lng = round(request.lng, COORDINATE_PRECISION)
+
+        if GOOGLE_MAPS_CONFIGURED:
+            # Run the geomagnetic math alongside the timezone round trip
+            # (the thread hop is hidden behind the network latency)
+            tz_result, (geomag_lat, declination, storm_impact) = await asyncio.gather(
+                get_timezone(lat, lng),
+                asyncio.to_thread(analyze_geomagnetics, lat, lng)
+            )
+        else:
+            tz_result = None
+            # Calculate geomagnetic properties (memoized per coordinate pair)
+            geomag_lat, declination, storm_impact = analyze_geomagnetics(lat, lng)
+
+        # Build the dual-case payload directly - every key is known here, so
+        # there is no need for add_camel_case_aliases to walk it afterwards
+        storm_impact_data = {
+            "factor": storm_impact.factor,
+            "description": storm_impact.description,
+            "aurora_likelihood": storm_impact.aurora_likelihood,
+            "auroraLikelihood": storm_impact.aurora_likelihood
+        }
         analysis_data = {
             "coordinates": {
-                "lat": lat,
-                "lng": lng
+                "lat": request.lat,
+                "lng": request.lng
             },
             "geomagnetic": {
                 "latitude": geomag_lat,
                 "declination": declination
             },
-            "storm_impact": {
-                "factor": storm_impact.factor,
-                "description": storm_impact.description,
-                "aurora_likelihood": storm_impact.aurora_likelihood
-            }
+            "storm_impact": storm_impact_data,
+            "stormImpact": storm_impact_data
         }
 
-        # Get timezone if Google Maps is configured
-        if is_google_maps_configured():
-            tz_result = await get_timezone(lat, lng)
-            if tz_result.success and tz_result.timezone_id:
-                analysis_data["timezone"] = {
-                    "id": tz_result.timezone_id,
-                    "name": tz_result.timezone_name or tz_result.timezone_id,
-                    "utc_offset": (tz_result.raw_offset or 0) + (tz_result.dst_offset or 0)
-                }
-
-        return success_response(
-            data=analysis_data,
-            cached=False,  # Calculations are computed on-demand
-            source="heliometric"
-        )
+        # Add timezone if Google Maps is configured and the lookup succeeded
+        if tz_result is not None and tz_result.success and tz_result.timezone_id:
+            utc_offset = (tz_result.raw_offset or 0) + (tz_result.dst_offset or 0)
+            analysis_data["timezone"] = {
+                "id": tz_result.timezone_id,
+                "name": tz_result.timezone_name or tz_result.timezone_id,
+                "utc_offset": utc_offset,
+                "utcOffset": utc_offset
+            }
+
+        return ORJSONResponse({
+            "success": True,
+            "data": analysis_data,
+            # Calculations are computed on-demand
+            "meta": response_meta(cached=False, source="heliometric")
+        })
 
     except ValueError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content=error_response(
                 code=ErrorCodes.VALIDATION_ERROR,
@@ -148,14 +200,61 @@ async def analyze_location(request: LocationRequest):
     except Exception as e:
         import logging
         logging.getLogger(__name__).error(f"Location analysis error: {e}", exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content=error_response(
-                code=ErrorCodes.INTERNAL_ERROR,
-                message="Failed to analyze location",
-                status_code=500,
-            )
-        )
+        return _INTERNAL_ERROR.response()
+
+
+@router.post("/location/bulk")
+async def analyze_location_bulk(request: BulkLocationRequest):
+    """
+    Geomagnetic analysis for up to 1000 coordinates in one request.
+
+    Results are returned column-wise, index-aligned with the request arrays.
+    Timezone lookup is not included.
+
+    Request Body:
+        lat: Array of latitudes (-90 to 90)
+        lng: Array of longitudes (-180 to 180), same length as lat
+
+    Returns:
+        Standardized API response with geomagnetic_latitude, declination,
+        storm_impact_factor and aurora_likelihood arrays
+    """
+    geomag_lats, declinations, impacts = analyze_geomagnetics_batch(request.lat, request.lng)
+
+    return success_response(
+        data={
+            "count": len(geomag_lats),
+            "geomagnetic_latitude": geomag_lats,
+            "declination": declinations,
+            "storm_impact_factor": [impact.factor for impact in impacts],
+            "aurora_likelihood": [impact.aurora_likelihood for impact in impacts]
+        },
+        cached=False,
+        source="heliometric"
+    )
+
+
+# Maps availability is fixed at import, so the whole payload is static
+LOCATION_INFO_DATA = add_camel_case_aliases({
+    "endpoint": "POST /api/location",
+    "method": "POST",
+    "body": {
+        "lat": "number (required, -90 to 90)",
+        "lng": "number (required, -180 to 180)"
+    },
+    "description": "Get geomagnetic impact analysis for coordinates",
+    "timezone_available": GOOGLE_MAPS_CONFIGURED,
+    "features": [
+        "geomagnetic_latitude",
+        "magnetic_declination",
+        "storm_impact_factor",
+        "aurora_likelihood",
+        "timezone_lookup"
+    ]
+})
+
+# Pre-serialized body; only the meta block is appended per request
+_LOCATION_INFO_BODY_HEAD = b'{"success":true,"data":' + orjson.dumps(LOCATION_INFO_DATA) + b',"meta":'
 
 
 @router.get("/location")
@@ -166,23 +265,7 @@ async def location_info():
     Returns information about the location analysis endpoint
     including whether timezone lookup is available.
     """
-    return success_response(
-        data={
-            "endpoint": "POST /api/location",
-            "method": "POST",
-            "body": {
-                "lat": "number (required, -90 to 90)",
-                "lng": "number (required, -180 to 180)"
-            },
-            "description": "Get geomagnetic impact analysis for coordinates",
-            "timezone_available": is_google_maps_configured(),
-            "features": [
-                "geomagnetic_latitude",
-                "magnetic_declination",
-                "storm_impact_factor",
-                "aurora_likelihood",
-                "timezone_lookup"
-            ]
-        },
-        source="documentation"
+    return Response(
+        b"".join((_LOCATION_INFO_BODY_HEAD, orjson.dumps(response_meta(source="documentation")), b"}")),
+        media_type="application/json",
     )
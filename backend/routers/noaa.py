@@ -3,20 +3,37 @@ NOAA Space Weather API Router
 Provides NOAA K-Index data with standardized API responses
 """
 
+import orjson
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from services.noaa import (
-    fetch_kindex,
+    fetch_kindex_json,
     get_kindex_description,
     get_kindex_color
 )
 from utils.responses import (
     success_response,
-    error_response,
-    ErrorCodes
+    response_meta,
+    ErrorCodes,
+    ErrorTemplate,
+    ORJSONResponse
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Fixed failure responses, serialized once
+_UNAVAILABLE_ERROR = ErrorTemplate(ErrorCodes.EXTERNAL_API_ERROR, "Unable to fetch NOAA data", status_code=503)
+_INTERNAL_ERROR = ErrorTemplate(ErrorCodes.INTERNAL_ERROR, "Failed to process NOAA data", status_code=500)
+_KP_RANGE_ERROR = ErrorTemplate(
+    ErrorCodes.VALIDATION_ERROR,
+    "K-Index value must be between 0 and 9",
+    status_code=400,
+    field="kp_value"
+)
+
+# Envelope pieces around the pre-serialized K-Index payload
+_NOAA_BODY_HEAD = b'{"success":true,"data":'
+_NOAA_BODY_MID = b',"meta":'
 
 
 @router.get("/noaa")
@@ -37,44 +54,26 @@ async def get_noaa_data():
     - is_simulated/isSimulated: True if using mock data
     """
     try:
-        data = await fetch_kindex()
-
-        if not data:
-            return JSONResponse(
-                status_code=503,
-                content=error_response(
-                    code=ErrorCodes.EXTERNAL_API_ERROR,
-                    message="Unable to fetch NOAA data",
-                    status_code=503
-                )
-            )
-
-        # Add description and color for the latest reading
-        if "latest" in data:
-            kp = data["latest"]["kp_index"]
-            data["description"] = get_kindex_description(kp)
-            data["color"] = get_kindex_color(kp)
+        payload, is_simulated = await fetch_kindex_json()
 
-        # Check if data is cached (simulated data indicates no cache or API failure)
-        is_cached = not data.get("is_simulated", False)
+        if payload is None:
+            return _UNAVAILABLE_ERROR.response()
 
-        return success_response(
-            data=data,
-            cached=is_cached,
-            source="noaa_swpc"
+        # Check if data is cached (simulated data indicates no cache or API failure)
+        is_cached = not is_simulated
+
+        return Response(
+            b"".join((
+                _NOAA_BODY_HEAD, payload, _NOAA_BODY_MID,
+                orjson.dumps(response_meta(cached=is_cached, source="noaa_swpc")), b"}",
+            )),
+            media_type="application/json",
         )
 
     except Exception as e:
         import logging
         logging.getLogger(__name__).error(f"NOAA data error: {e}", exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content=error_response(
-                code=ErrorCodes.INTERNAL_ERROR,
-                message="Failed to process NOAA data",
-                status_code=500,
-            )
-        )
+        return _INTERNAL_ERROR.response()
 
 
 @router.get("/noaa/description/{kp_value}")
@@ -90,15 +89,7 @@ async def get_kp_description(kp_value: float):
     """
     # Validate input range
     if kp_value < 0 or kp_value > 9:
-        return JSONResponse(
-            status_code=400,
-            content=error_response(
-                code=ErrorCodes.VALIDATION_ERROR,
-                message="K-Index value must be between 0 and 9",
-                status_code=400,
-                field="kp_value"
-            )
-        )
+        return _KP_RANGE_ERROR.response()
 
     return success_response(
         data={
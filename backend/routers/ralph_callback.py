@@ -6,21 +6,42 @@ This endpoint receives requests from Ralph and responds with the requested data.
 All requests are authenticated via HMAC signature verification.
 """
 
-import json
+import asyncio
+import bisect
+import heapq
 import logging
+import random
+import re
+import threading
+import time
 import traceback
+from collections import Counter, deque
+from itertools import compress, islice
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
+import orjson
 from fastapi import APIRouter, Request, Header, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from services import ralph_monitor
 from services.ralph_monitor import APP_VERSION, APP_NAME, CLIENT_VERSION, get_uptime_seconds
+from utils.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+try:
+    import psutil
+    HAS_PSUTIL = True
+    _PROCESS = psutil.Process()
+    # Prime the CPU counter so later non-blocking reads report a real delta
+    psutil.cpu_percent(interval=None)
+except ImportError:
+    HAS_PSUTIL = False
+    _PROCESS = None
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ============================================================================
@@ -48,18 +69,54 @@ class RalphCallbackResponse(BaseModel):
 
 # Simple in-memory log buffer for recent logs
 # In production, you might want to use a proper logging backend
-_log_buffer: List[Dict[str, Any]] = []
+# A bounded deque evicts the oldest entry in O(1) once full
 _max_log_buffer_size = 1000
+_log_buffer: deque[Dict[str, Any]] = deque(maxlen=_max_log_buffer_size)
+
+# Parallel columns (struct-of-arrays) over the same entries, so filters and
+# aggregations run over plain ints/strings instead of per-entry dict lookups.
+# Entries arrive in time order and ISO strings sort chronologically, so
+# time-window cutoffs are found by bisecting _log_timestamps.
+_log_timestamps: deque[str] = deque(maxlen=_max_log_buffer_size)
+_log_levels: deque[int] = deque(maxlen=_max_log_buffer_size)
+_log_message_prefixes: deque[str] = deque(maxlen=_max_log_buffer_size)
+
+# Error grouping key length in analyze_logs
+MESSAGE_PREFIX_LENGTH = 100
+
+# Keeps the columns in lockstep between the handler and readers
+_log_lock = threading.Lock()
+
+LEVEL_ORDER = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+
+# (epoch millisecond, ISO timestamp) of the last emitted record
+_last_log_timestamp: tuple[int, str] = (0, "")
+
+
+def _log_timestamp(created: float) -> str:
+    """ISO 8601 timestamp for a record's creation time, formatted once per millisecond."""
+    global _last_log_timestamp
+    ms = int(created * 1000)
+    if ms != _last_log_timestamp[0]:
+        _last_log_timestamp = (
+            ms,
+            datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat(timespec="milliseconds") + "Z"
+        )
+    return _last_log_timestamp[1]
+
+
+def _utc_iso() -> str:
+    """Current UTC time in the callback payloads' ISO 8601 format."""
+    return f"{datetime.now(timezone.utc).isoformat()}Z"
 
 
 class RalphLogHandler(logging.Handler):
     """Custom log handler that stores logs in memory for Ralph to fetch."""
 
     def emit(self, record: logging.LogRecord):
-        global _log_buffer
-
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _log_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -72,11 +129,11 @@ class RalphLogHandler(logging.Handler):
         if record.exc_info:
             log_entry["exception"] = "".join(traceback.format_exception(*record.exc_info))
 
-        _log_buffer.append(log_entry)
-
-        # Trim buffer if too large
-        if len(_log_buffer) > _max_log_buffer_size:
-            _log_buffer = _log_buffer[-_max_log_buffer_size:]
+        with _log_lock:
+            _log_buffer.append(log_entry)
+            _log_timestamps.append(log_entry["timestamp"])
+            _log_levels.append(record.levelno)
+            _log_message_prefixes.append(log_entry["message"][:MESSAGE_PREFIX_LENGTH])
 
 
 def setup_ralph_logging():
@@ -90,6 +147,33 @@ def setup_ralph_logging():
 # Helper Functions
 # ============================================================================
 
+# (epoch second, hours, cutoff string) of the last computed time window
+_last_cutoff: tuple[int, int, str] = (0, 0, "")
+
+
+def _cutoff_iso(hours: int) -> str:
+    """
+    ISO timestamp N hours ago, comparable with buffered entry timestamps.
+
+    Whole-second resolution, so repeated callbacks within the same second
+    reuse the formatted string instead of redoing the datetime arithmetic.
+    """
+    global _last_cutoff
+    now = int(time.time())
+    if (now, hours) != _last_cutoff[:2]:
+        cutoff = datetime.fromtimestamp(now, tz=timezone.utc) - timedelta(hours=hours)
+        _last_cutoff = (now, hours, f"{cutoff.isoformat()}Z")
+    return _last_cutoff[2]
+
+
+def _columns_since(hours: int, *columns: deque) -> List[list]:
+    """Slices of the given log buffer columns covering the last N hours, oldest first."""
+    cutoff_str = _cutoff_iso(hours)
+    with _log_lock:
+        start = bisect.bisect_left(_log_timestamps, cutoff_str)
+        return [list(islice(column, start, None)) for column in columns]
+
+
 def fetch_recent_logs(
     lines: int = 100,
     min_level: str = "ERROR",
@@ -106,20 +190,16 @@ def fetch_recent_logs(
     Returns:
         List of log entries
     """
-    level_order = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
-    min_level_value = level_order.get(min_level.upper(), 40)
+    min_level_value = LEVEL_ORDER.get(min_level.upper(), 40)
 
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-    cutoff_str = cutoff_time.isoformat() + "Z"
+    levels, entries = _columns_since(hours, _log_levels, _log_buffer)
 
-    filtered_logs = [
-        log for log in _log_buffer
-        if level_order.get(log.get("level", "INFO"), 20) >= min_level_value
-        and log.get("timestamp", "") >= cutoff_str
-    ]
-
-    # Return most recent logs first
-    return list(reversed(filtered_logs[-lines:]))
+    # Walk the window newest-first and stop once enough entries match
+    matching = (
+        entries[i] for i in range(len(levels) - 1, -1, -1)
+        if levels[i] >= min_level_value
+    )
+    return list(islice(matching, lines))
 
 
 def analyze_logs(
@@ -136,45 +216,42 @@ def analyze_logs(
     Returns:
         Analysis summary
     """
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-    cutoff_str = cutoff_time.isoformat() + "Z"
-
-    recent_logs = [
-        log for log in _log_buffer
-        if log.get("timestamp", "") >= cutoff_str
-    ]
+    levels, timestamps, messages = _columns_since(
+        hours, _log_levels, _log_timestamps, _log_message_prefixes
+    )
 
     # Count by level
-    level_counts = {}
-    for log in recent_logs:
-        level = log.get("level", "UNKNOWN")
-        level_counts[level] = level_counts.get(level, 0) + 1
-
-    # Find errors
-    errors = [log for log in recent_logs if log.get("level") in ("ERROR", "CRITICAL")]
+    counts = Counter(levels)
+    level_counts = {
+        logging.getLevelName(level): count for level, count in counts.items()
+    }
+    total_errors = sum(count for level, count in counts.items() if level >= logging.ERROR)
 
-    # Group errors by message (simplified)
+    # Group errors by message prefix (simplified). compress/map select the
+    # error rows in C, so the loop body only runs for errors.
     error_groups = {}
-    for error in errors:
-        msg = error.get("message", "")[:100]  # First 100 chars
-        if msg not in error_groups:
-            error_groups[msg] = {"count": 0, "first_seen": error.get("timestamp"), "last_seen": error.get("timestamp")}
-        error_groups[msg]["count"] += 1
-        error_groups[msg]["last_seen"] = error.get("timestamp")
-
-    # Sort by count and get top errors
-    top_errors = sorted(
-        [{"message": k, **v} for k, v in error_groups.items()],
-        key=lambda x: x["count"],
-        reverse=True
-    )[:10]
-
-    # Filter by pattern if specified
+    error_rows = compress(zip(timestamps, messages), map(logging.ERROR.__le__, levels))
+    for timestamp, msg in error_rows:
+        group = error_groups.get(msg)
+        if group is None:
+            error_groups[msg] = {"count": 1, "first_seen": timestamp, "last_seen": timestamp}
+        else:
+            group["count"] += 1
+            group["last_seen"] = timestamp
+
+    # Filter by pattern first, so matches beyond the overall top 10 still count
+    groups = error_groups.items()
     if pattern:
-        top_errors = [e for e in top_errors if pattern.lower() in e["message"].lower()]
+        search = re.compile(re.escape(pattern), re.IGNORECASE).search
+        groups = [(msg, group) for msg, group in groups if search(msg)]
+
+    # Top 10 by count without sorting every group
+    top_errors = [
+        {"message": msg, **group}
+        for msg, group in heapq.nlargest(10, groups, key=lambda item: item[1]["count"])
+    ]
 
     # Determine trend
-    total_errors = len(errors)
     trend = "stable"
     if total_errors > 50:
         trend = "increasing"
@@ -182,7 +259,7 @@ def analyze_logs(
         trend = "decreasing"
 
     return {
-        "total_logs": len(recent_logs),
+        "total_logs": len(levels),
         "total_errors": total_errors,
         "unique_errors": len(error_groups),
         "level_counts": level_counts,
@@ -192,74 +269,100 @@ def analyze_logs(
     }
 
 
+# Static schemas, built once and shared by every schema_request
+_API_SCHEMA: Dict[str, Any] = {
+    "note": "Schema available at /api/openapi.json",
+    "version": APP_VERSION
+}
+
+_EVENT_SCHEMA: Dict[str, Any] = {
+    "events": [
+        {
+            "name": "startup",
+            "description": "Application startup event",
+            "fields": ["version", "timestamp"]
+        },
+        {
+            "name": "shutdown",
+            "description": "Application shutdown event",
+            "fields": ["reason", "uptime_seconds"]
+        },
+        {
+            "name": "error",
+            "description": "Application error event",
+            "fields": ["title", "message", "severity", "traceback"]
+        },
+        {
+            "name": "noaa_fetch",
+            "description": "NOAA data fetch event",
+            "fields": ["kp_index", "status", "cached"]
+        }
+    ]
+}
+
+_DATA_SCHEMA: Dict[str, Any] = {
+    "models": {
+        "KIndexReading": {
+            "description": "Single K-Index reading from NOAA",
+            "fields": {
+                "time_tag": "string (ISO timestamp)",
+                "kp_index": "float (0-9)",
+                "observed_time": "datetime"
+            }
+        },
+        "LocationAnalysis": {
+            "description": "Geomagnetic analysis for a location",
+            "fields": {
+                "coordinates": {"lat": "float", "lng": "float"},
+                "geomagnetic": {"latitude": "float", "declination": "float"},
+                "storm_impact": {"factor": "float", "description": "string", "aurora_likelihood": "string"}
+            }
+        },
+        "GeoLocation": {
+            "description": "Geocoded location",
+            "fields": {
+                "lat": "float",
+                "lng": "float",
+                "formatted_address": "string",
+                "place_id": "string"
+            }
+        }
+    }
+}
+
+
 def get_api_schema() -> Dict[str, Any]:
     """Return the OpenAPI schema for this API."""
-    # This will be populated by the main app
-    return {
-        "note": "Schema available at /api/openapi.json",
-        "version": APP_VERSION
-    }
+    return _API_SCHEMA
 
 
 def get_event_schema() -> Dict[str, Any]:
     """Return the event schema for this application."""
-    return {
-        "events": [
-            {
-                "name": "startup",
-                "description": "Application startup event",
-                "fields": ["version", "timestamp"]
-            },
-            {
-                "name": "shutdown",
-                "description": "Application shutdown event",
-                "fields": ["reason", "uptime_seconds"]
-            },
-            {
-                "name": "error",
-                "description": "Application error event",
-                "fields": ["title", "message", "severity", "traceback"]
-            },
-            {
-                "name": "noaa_fetch",
-                "description": "NOAA data fetch event",
-                "fields": ["kp_index", "status", "cached"]
-            }
-        ]
-    }
+    return _EVENT_SCHEMA
 
 
 def get_data_schema() -> Dict[str, Any]:
     """Return the data model schema for this application."""
-    return {
-        "models": {
-            "KIndexReading": {
-                "description": "Single K-Index reading from NOAA",
-                "fields": {
-                    "time_tag": "string (ISO timestamp)",
-                    "kp_index": "float (0-9)",
-                    "observed_time": "datetime"
-                }
-            },
-            "LocationAnalysis": {
-                "description": "Geomagnetic analysis for a location",
-                "fields": {
-                    "coordinates": {"lat": "float", "lng": "float"},
-                    "geomagnetic": {"latitude": "float", "declination": "float"},
-                    "storm_impact": {"factor": "float", "description": "string", "aurora_likelihood": "string"}
-                }
-            },
-            "GeoLocation": {
-                "description": "Geocoded location",
-                "fields": {
-                    "lat": "float",
-                    "lng": "float",
-                    "formatted_address": "string",
-                    "place_id": "string"
-                }
-            }
-        }
-    }
+    return _DATA_SCHEMA
+
+
+_KINDEX_STATUSES = ("quiet", "unsettled", "storm")
+
+_SAMPLE_LOCATIONS = [
+    {"name": "New York", "lat": 40.7128, "lng": -74.0060},
+    {"name": "London", "lat": 51.5074, "lng": -0.1278},
+    {"name": "Tokyo", "lat": 35.6762, "lng": 139.6503},
+    {"name": "Sydney", "lat": -33.8688, "lng": 151.2093},
+    {"name": "Reykjavik", "lat": 64.1466, "lng": -21.9426},
+]
+
+_SAMPLE_ZODIACS = [
+    {"name": "Rat", "element": "Water", "year": 2020},
+    {"name": "Ox", "element": "Earth", "year": 2021},
+    {"name": "Tiger", "element": "Wood", "year": 2022},
+    {"name": "Rabbit", "element": "Wood", "year": 2023},
+    {"name": "Dragon", "element": "Earth", "year": 2024},
+]
 
 
 def generate_test_data(data_type: str = "sample", count: int = 5) -> List[Dict[str, Any]]:
@@ -273,46 +376,35 @@ def generate_test_data(data_type: str = "sample", count: int = 5) -> List[Dict[s
     Returns:
         List of sample data
     """
-    import random
-
     if data_type == "kindex" or data_type == "noaa":
+        n = max(count, 0)
+        uniform = random.uniform
+        statuses = random.choices(_KINDEX_STATUSES, k=n)
         return [
             {
                 "time_tag": f"2026-01-26T{10+i:02d}:00:00Z",
-                "kp_index": round(random.uniform(1.0, 7.0), 2),
-                "status": random.choice(["quiet", "unsettled", "storm"])
+                "kp_index": round(uniform(1.0, 7.0), 2),
+                "status": statuses[i]
             }
-            for i in range(count)
+            for i in range(n)
         ]
 
     elif data_type == "location":
-        locations = [
-            {"name": "New York", "lat": 40.7128, "lng": -74.0060},
-            {"name": "London", "lat": 51.5074, "lng": -0.1278},
-            {"name": "Tokyo", "lat": 35.6762, "lng": 139.6503},
-            {"name": "Sydney", "lat": -33.8688, "lng": 151.2093},
-            {"name": "Reykjavik", "lat": 64.1466, "lng": -21.9426},
-        ]
-        return locations[:count]
+        return [dict(loc) for loc in _SAMPLE_LOCATIONS[:count]]
 
     elif data_type == "zodiac":
-        zodiacs = [
-            {"name": "Rat", "element": "Water", "year": 2020},
-            {"name": "Ox", "element": "Earth", "year": 2021},
-            {"name": "Tiger", "element": "Wood", "year": 2022},
-            {"name": "Rabbit", "element": "Wood", "year": 2023},
-            {"name": "Dragon", "element": "Earth", "year": 2024},
-        ]
-        return zodiacs[:count]
+        return [dict(z) for z in _SAMPLE_ZODIACS[:count]]
 
     else:
         # Generic sample data
+        timestamp = _utc_iso()
+        rand = random.random
         return [
             {
                 "id": i + 1,
                 "type": data_type,
-                "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
-                "value": round(random.random() * 100, 2)
+                "timestamp": timestamp,
+                "value": round(rand() * 100, 2)
             }
             for i in range(count)
         ]
@@ -322,17 +414,16 @@ def get_system_metrics() -> Dict[str, Any]:
     """Get current system metrics."""
     metrics = {
         "uptime_seconds": get_uptime_seconds(),
-        "timestamp": datetime.now(timezone.utc).isoformat() + "Z"
+        "timestamp": _utc_iso()
     }
 
     # Try to get CPU/memory metrics
-    try:
-        import psutil
-        metrics["cpu_percent"] = psutil.cpu_percent(interval=0.1)
-        memory = psutil.Process().memory_info()
+    if HAS_PSUTIL:
+        metrics["cpu_percent"] = psutil.cpu_percent(interval=None)
+        memory = _PROCESS.memory_info()
         metrics["memory_mb"] = round(memory.rss / 1024 / 1024, 2)
-        metrics["memory_percent"] = psutil.Process().memory_percent()
-    except ImportError:
+        metrics["memory_percent"] = _PROCESS.memory_percent()
+    else:
         metrics["cpu_percent"] = None
         metrics["memory_mb"] = None
         metrics["note"] = "psutil not installed - limited metrics available"
@@ -340,6 +431,186 @@ def get_system_metrics() -> Dict[str, Any]:
     return metrics
 
 
+# ============================================================================
+# Callback Request Handlers
+# ============================================================================
+
+async def _handle_health_check(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Basic health check."""
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": {
+            "healthy": True,
+            "service": APP_NAME,
+            "version": APP_VERSION,
+            "uptime_seconds": get_uptime_seconds(),
+            "timestamp": _utc_iso()
+        }
+    }
+
+
+async def _handle_log_fetch(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch recent log entries."""
+    lines = max(1, min(int(payload.get("lines", 100)), 1000))
+    level = str(payload.get("level", "ERROR")).upper()
+    if level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+        level = "ERROR"
+    since_hours = max(1, min(int(payload.get("since_hours", 24)), 720))
+
+    logs = fetch_recent_logs(lines=lines, min_level=level, hours=since_hours)
+
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": {
+            "logs": logs,
+            "count": len(logs),
+            "filters": {"lines": lines, "level": level, "since_hours": since_hours}
+        }
+    }
+
+
+async def _handle_log_analysis(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze logs for patterns."""
+    pattern = payload.get("error_pattern")
+    if pattern is not None:
+        pattern = str(pattern)[:200]  # Limit pattern length
+    hours = max(1, min(int(payload.get("time_range_hours", 24)), 720))
+
+    analysis = analyze_logs(pattern=pattern, hours=hours)
+
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": analysis
+    }
+
+
+# Pre-serialized schema_request bodies; only the request_id varies per call
+_SCHEMA_BODIES: Dict[str, bytes] = {
+    "api": orjson.dumps({
+        "type": "api",
+        "openapi_url": "/api/openapi.json",
+        "docs_url": "/api/docs",
+        "version": APP_VERSION
+    }),
+    "database": orjson.dumps(_DATA_SCHEMA),
+    "data": orjson.dumps(_DATA_SCHEMA),
+    "events": orjson.dumps(_EVENT_SCHEMA),
+}
+_SCHEMA_BODY_ALL = orjson.dumps({
+    "api": _API_SCHEMA,
+    "data": _DATA_SCHEMA,
+    "events": _EVENT_SCHEMA
+})
+_SCHEMA_BODY_HEAD = b'{"request_id":'
+_SCHEMA_BODY_MID = b',"status":"success","data":'
+
+
+async def _handle_schema_request(request_id: str, payload: Dict[str, Any]) -> Response:
+    """Return API/database/event schema."""
+    schema_type = payload.get("schema_type", "api")
+    data = _SCHEMA_BODIES.get(schema_type, _SCHEMA_BODY_ALL) if isinstance(schema_type, str) else _SCHEMA_BODY_ALL
+
+    return Response(
+        content=_SCHEMA_BODY_HEAD + orjson.dumps(request_id) + _SCHEMA_BODY_MID + data + b"}",
+        media_type="application/json"
+    )
+
+
+async def _handle_test_data(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate test/demo data."""
+    data_type = payload.get("data_type", "sample")
+    count = min(payload.get("count", 5), 100)  # Cap at 100
+
+    samples = generate_test_data(data_type=data_type, count=count)
+
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": {
+            "samples": samples,
+            "type": data_type,
+            "count": len(samples)
+        }
+    }
+
+
+# metric_types entry -> metrics keys it selects
+_METRIC_FIELDS: Dict[str, tuple[str, ...]] = {
+    "cpu": ("cpu_percent",),
+    "memory": ("memory_mb", "memory_percent"),
+    "uptime": ("uptime_seconds",),
+}
+
+
+async def _handle_metrics(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return performance metrics."""
+    metric_types = payload.get("metric_types", ["cpu", "memory", "uptime"])
+
+    # psutil reads /proc synchronously; keep it off the event loop
+    metrics = await asyncio.to_thread(get_system_metrics) if HAS_PSUTIL else get_system_metrics()
+
+    # Filter to requested metrics
+    if metric_types:
+        filtered_metrics = {"timestamp": metrics.get("timestamp")}
+        for mt in metric_types:
+            fields = _METRIC_FIELDS.get(mt, ()) if isinstance(mt, str) else ()
+            for key in fields:
+                filtered_metrics[key] = metrics.get(key)
+        metrics = filtered_metrics
+
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": metrics
+    }
+
+
+async def _handle_update_check(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Check for Ralph SDK updates."""
+    update_info = await ralph_monitor.check_for_updates_async()
+
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": {
+            "client_version": CLIENT_VERSION,
+            "app_version": APP_VERSION,
+            "update_info": update_info
+        }
+    }
+
+
+async def _handle_version_info(request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return version information."""
+    return {
+        "request_id": request_id,
+        "status": "success",
+        "data": {
+            "app_name": APP_NAME,
+            "app_version": APP_VERSION,
+            "client_version": CLIENT_VERSION,
+            "uptime_seconds": get_uptime_seconds(),
+            "config": ralph_monitor.get_config_status()
+        }
+    }
+
+
+# Request type -> handler
+_HANDLERS: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[Union[Dict[str, Any], Response]]]] = {
+    "health_check": _handle_health_check,
+    "log_fetch": _handle_log_fetch,
+    "log_analysis": _handle_log_analysis,
+    "schema_request": _handle_schema_request,
+    "test_data": _handle_test_data,
+    "metrics": _handle_metrics,
+    "update_check": _handle_update_check,
+    "version_info": _handle_version_info,
+}
+
+
 # ============================================================================
 # Callback Endpoint
 # ============================================================================
@@ -370,8 +641,8 @@ async def ralph_callback(
         raise HTTPException(status_code=401, detail="Invalid signature")
 
     try:
-        data = json.loads(body)
-    except json.JSONDecodeError:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
 
     request_id = data.get("request_id", "unknown")
@@ -380,166 +651,18 @@ async def ralph_callback(
 
     logger.info(f"Ralph callback received: type={request_type}, request_id={request_id}")
 
-    try:
-        if request_type == "health_check":
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": {
-                    "healthy": True,
-                    "service": APP_NAME,
-                    "version": APP_VERSION,
-                    "uptime_seconds": get_uptime_seconds(),
-                    "timestamp": datetime.now(timezone.utc).isoformat() + "Z"
-                }
-            }
-
-        elif request_type == "log_fetch":
-            lines = max(1, min(int(payload.get("lines", 100)), 1000))
-            level = str(payload.get("level", "ERROR")).upper()
-            if level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
-                level = "ERROR"
-            since_hours = max(1, min(int(payload.get("since_hours", 24)), 720))
-
-            logs = fetch_recent_logs(lines=lines, min_level=level, hours=since_hours)
-
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": {
-                    "logs": logs,
-                    "count": len(logs),
-                    "filters": {"lines": lines, "level": level, "since_hours": since_hours}
-                }
-            }
-
-        elif request_type == "log_analysis":
-            pattern = payload.get("error_pattern")
-            if pattern is not None:
-                pattern = str(pattern)[:200]  # Limit pattern length
-            hours = max(1, min(int(payload.get("time_range_hours", 24)), 720))
-
-            analysis = analyze_logs(pattern=pattern, hours=hours)
-
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": analysis
-            }
-
-        elif request_type == "schema_request":
-            schema_type = payload.get("schema_type", "api")
-
-            if schema_type == "api":
-                return {
-                    "request_id": request_id,
-                    "status": "success",
-                    "data": {
-                        "type": "api",
-                        "openapi_url": "/api/openapi.json",
-                        "docs_url": "/api/docs",
-                        "version": APP_VERSION
-                    }
-                }
-            elif schema_type == "database" or schema_type == "data":
-                return {
-                    "request_id": request_id,
-                    "status": "success",
-                    "data": get_data_schema()
-                }
-            elif schema_type == "events":
-                return {
-                    "request_id": request_id,
-                    "status": "success",
-                    "data": get_event_schema()
-                }
-            else:
-                return {
-                    "request_id": request_id,
-                    "status": "success",
-                    "data": {
-                        "api": get_api_schema(),
-                        "data": get_data_schema(),
-                        "events": get_event_schema()
-                    }
-                }
-
-        elif request_type == "test_data":
-            data_type = payload.get("data_type", "sample")
-            count = min(payload.get("count", 5), 100)  # Cap at 100
-
-            samples = generate_test_data(data_type=data_type, count=count)
-
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": {
-                    "samples": samples,
-                    "type": data_type,
-                    "count": len(samples)
-                }
-            }
-
-        elif request_type == "metrics":
-            metric_types = payload.get("metric_types", ["cpu", "memory", "uptime"])
-
-            metrics = get_system_metrics()
-
-            # Filter to requested metrics
-            if metric_types:
-                filtered_metrics = {"timestamp": metrics.get("timestamp")}
-                for mt in metric_types:
-                    if mt == "cpu" and "cpu_percent" in metrics:
-                        filtered_metrics["cpu_percent"] = metrics["cpu_percent"]
-                    elif mt == "memory" and "memory_mb" in metrics:
-                        filtered_metrics["memory_mb"] = metrics["memory_mb"]
-                        filtered_metrics["memory_percent"] = metrics.get("memory_percent")
-                    elif mt == "uptime":
-                        filtered_metrics["uptime_seconds"] = metrics["uptime_seconds"]
-                metrics = filtered_metrics
-
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": metrics
-            }
-
-        elif request_type == "update_check":
-            # Check for Ralph SDK updates
-            update_info = await ralph_monitor.check_for_updates_async()
-
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": {
-                    "client_version": CLIENT_VERSION,
-                    "app_version": APP_VERSION,
-                    "update_info": update_info
-                }
-            }
-
-        elif request_type == "version_info":
-            # Return version information
-            return {
-                "request_id": request_id,
-                "status": "success",
-                "data": {
-                    "app_name": APP_NAME,
-                    "app_version": APP_VERSION,
-                    "client_version": CLIENT_VERSION,
-                    "uptime_seconds": get_uptime_seconds(),
-                    "config": ralph_monitor.get_config_status()
-                }
-            }
-
-        else:
-            logger.warning(f"Unknown Ralph request type: {request_type}")
-            return {
-                "request_id": request_id,
-                "status": "error",
-                "error": f"Unknown request type: {request_type}"
-            }
+    # Non-string types (e.g. a list) are unhashable; treat them as unknown
+    handler = _HANDLERS.get(request_type) if isinstance(request_type, str) else None
+    if handler is None:
+        logger.warning(f"Unknown Ralph request type: {request_type}")
+        return {
+            "request_id": request_id,
+            "status": "error",
+            "error": f"Unknown request type: {request_type}"
+        }
 
+    try:
+        return await handler(request_id, payload)
     except Exception as e:
         logger.error(f"Error handling Ralph callback: {e}", exc_info=True)
         return {
@@ -11,30 +11,53 @@ All endpoints require API key authentication via X-Research-Key header.
 Set RESEARCH_API_KEY environment variable to enable access.
 """
 
+import asyncio
 import os
 import re
 import hmac
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends, Security, Query
+from typing import Callable, Optional
+from fastapi import APIRouter, HTTPException, Depends, Security, Query, Request
+from fastapi.responses import Response
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel, Field
 import logging
+from datetime import datetime, timezone
+
+import orjson
+
+from utils.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
+try:
+    from croniter import CroniterError
+    HAS_CRONITER = True
+except ImportError:
+    HAS_CRONITER = False
+
 from services.research_agent import (
     research_agent,
     SkillType,
+    SKILL_TYPE_VALUES,
 )
 from services.task_scheduler import (
     task_scheduler,
     ScheduleType,
     ScheduledTask,
+    SCHEDULE_TYPE_VALUES,
+    TASK_STATUS_VALUES,
+    TaskResult,
     create_daily_forecast_task,
     create_weekly_report_task,
     create_solar_term_alert_task,
+    next_cron_runs,
 )
 
+# Enum lookups by request value, without raising ValueError for bad input
+_SKILL_BY_VALUE = {skill.value: skill for skill in SkillType}
+_SKILL_VALUES = list(_SKILL_BY_VALUE)
+_SCHEDULE_BY_VALUE = {schedule.value: schedule for schedule in ScheduleType}
+
 # ============================================================================
 # Authentication
 # ============================================================================
@@ -62,25 +85,23 @@ MIN_CRON_INTERVAL_SECONDS = 300
 
 def validate_cron_expression(cron_expr: str) -> None:
     """Validate a cron expression and enforce minimum interval."""
-    try:
-        from croniter import croniter
-        if not croniter.is_valid(cron_expr):
+    if HAS_CRONITER:
+        # Check minimum interval by computing two consecutive runs; the parsed
+        # expression is cached and reused when the scheduler computes next_run
+        try:
+            first, second = next_cron_runs(cron_expr, datetime.now(timezone.utc), 2)
+        except CroniterError:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid cron expression: {cron_expr}"
             )
-        # Check minimum interval by computing two consecutive runs
-        from datetime import datetime, timezone
-        cron = croniter(cron_expr, datetime.now(timezone.utc))
-        first = cron.get_next(datetime)
-        second = cron.get_next(datetime)
         interval = (second - first).total_seconds()
         if interval < MIN_CRON_INTERVAL_SECONDS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Cron schedule too frequent. Minimum interval is {MIN_CRON_INTERVAL_SECONDS} seconds, got {int(interval)}s."
             )
-    except ImportError:
+    else:
         # croniter not available - do basic validation
         parts = cron_expr.strip().split()
         if len(parts) not in (5, 6):
@@ -90,7 +111,12 @@ def validate_cron_expression(cron_expr: str) -> None:
             )
 
 
-router = APIRouter(prefix="/api/research", tags=["research"], dependencies=[Depends(verify_research_api_key)])
+router = APIRouter(
+    prefix="/api/research",
+    tags=["research"],
+    dependencies=[Depends(verify_research_api_key)],
+    default_response_class=ORJSONResponse,
+)
 
 
 # ============================================================================
@@ -215,12 +241,11 @@ async def execute_skill(request: SkillRequest):
     - generate_report: Generate comprehensive analysis report
     - discuss: Free-form discussion
     """
-    try:
-        skill_type = SkillType(request.skill_type)
-    except ValueError:
+    skill_type = _SKILL_BY_VALUE.get(request.skill_type)
+    if skill_type is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid skill type: {request.skill_type}. Valid types: {[s.value for s in SkillType]}"
+            detail=f"Invalid skill type: {request.skill_type}. Valid types: {_SKILL_VALUES}"
         )
 
     try:
@@ -251,30 +276,111 @@ async def list_skills():
     }
 
 
+# Length of message/result previews in API responses
+PREVIEW_LENGTH = 500
+
+
+def _truncate(text: str, limit: int = PREVIEW_LENGTH) -> str:
+    """Shorten text to a preview, returning short text as-is without copying."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+def _task_to_dict(task: ScheduledTask) -> dict:
+    """TaskResponse fields for a scheduler task, as a plain dict."""
+    return {
+        "task_id": task.task_id,
+        "name": task.name,
+        "description": task.description,
+        "schedule_type": SCHEDULE_TYPE_VALUES[task.schedule_type],
+        "schedule_value": task.schedule_value,
+        "skill_type": SKILL_TYPE_VALUES[task.skill_type],
+        "status": TASK_STATUS_VALUES[task.status],
+        "last_run": task.last_run,
+        "next_run": task.next_run,
+        "run_count": task.run_count,
+    }
+
+
+def _result_to_dict(result: TaskResult) -> dict:
+    """TaskResultResponse fields for a scheduler execution result, as a plain dict."""
+    return {
+        "task_id": result.task_id,
+        "execution_id": result.execution_id,
+        "started_at": result.started_at,
+        "completed_at": result.completed_at,
+        "success": result.success,
+        "result_preview": _truncate(result.result_content),
+        "error": result.error,
+        "duration_ms": result.duration_ms,
+    }
+
+
+# Lets browsers keep authenticated listings but revalidate them (ETag) on every poll
+LIST_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag (so a 304 will do)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    )
+
+
+def _read_listing(read: Callable[[], list], etag_of: Callable[[], str], etag: str) -> tuple[list, Optional[str]]:
+    """
+    Read a listing and keep `etag` only if it still describes what was read.
+
+    `etag` must be taken before the read; the directory is fingerprinted
+    again afterwards, and if a write landed in between the ETag is dropped
+    rather than paired with a body it doesn't describe. Blocking, so run it
+    in a worker thread.
+    """
+    rows = read()
+    return rows, etag if etag_of() == etag else None
+
+
+def _list_headers(etag: Optional[str]) -> dict:
+    """Cache headers for a listing response, with the ETag when one is known."""
+    if etag is None:
+        return {"Cache-Control": LIST_CACHE_CONTROL}
+    return {"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL}
+
+
 # ============================================================================
 # Session Management Endpoints
 # ============================================================================
 
 @router.get("/sessions", response_model=list[SessionResponse])
-async def list_sessions():
+async def list_sessions(request: Request):
     """List all research sessions"""
-    sessions = research_agent.memory.list_sessions()
-    return [
-        SessionResponse(
-            session_id=s["session_id"],
-            created_at=s["created_at"],
-            updated_at=s["updated_at"],
-            message_count=s["message_count"],
-            context_keys=[],  # Not included in list for brevity
-        )
-        for s in sessions
-    ]
+    etag = await asyncio.to_thread(research_agent.memory.sessions_etag)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL})
+
+    sessions, etag = await asyncio.to_thread(
+        _read_listing, research_agent.memory.list_sessions, research_agent.memory.sessions_etag, etag
+    )
+    # The memory manager already yields the SessionResponse fields, so skip
+    # building and re-validating a model per session
+    return ORJSONResponse(
+        [
+            {**s, "context_keys": []}  # Not included in list for brevity
+            for s in sessions
+        ],
+        headers=_list_headers(etag),
+    )
 
 
 @router.get("/sessions/{session_id}")
 async def get_session(session_id: str):
     """Get a specific session with full history"""
-    session = research_agent.memory.load_session(session_id)
+    session = await asyncio.to_thread(research_agent.memory.load_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -287,7 +393,7 @@ async def get_session(session_id: str):
         "messages": [
             {
                 "role": m.role,
-                "content": m.content[:500] + "..." if len(m.content) > 500 else m.content,
+                "content": _truncate(m.content),
                 "timestamp": m.timestamp,
                 "skill_used": m.skill_used,
             }
@@ -299,10 +405,14 @@ async def get_session(session_id: str):
 @router.post("/sessions/{session_id}/context")
 async def update_session_context(session_id: str, context: dict):
     """Update the context for a session"""
-    session = research_agent.memory.get_or_create_session(session_id)
-    session.context.update(context)
-    research_agent.memory.save_session(session)
-    return {"success": True, "context_keys": list(session.context.keys())}
+    def _update() -> list[str]:
+        session = research_agent.memory.get_or_create_session(session_id)
+        session.context.update(context)
+        research_agent.memory.save_session(session)
+        return list(session.context.keys())
+
+    context_keys = await asyncio.to_thread(_update)
+    return {"success": True, "context_keys": context_keys}
 
 
 # ============================================================================
@@ -310,40 +420,30 @@ async def update_session_context(session_id: str, context: dict):
 # ============================================================================
 
 @router.get("/tasks", response_model=list[TaskResponse])
-async def list_tasks():
+async def list_tasks(request: Request):
     """List all scheduled tasks"""
-    tasks = task_scheduler.list_tasks()
-    return [
-        TaskResponse(
-            task_id=t.task_id,
-            name=t.name,
-            description=t.description,
-            schedule_type=t.schedule_type.value,
-            schedule_value=t.schedule_value,
-            skill_type=t.skill_type.value,
-            status=t.status.value,
-            last_run=t.last_run,
-            next_run=t.next_run,
-            run_count=t.run_count,
-        )
-        for t in tasks
-    ]
+    etag = await asyncio.to_thread(task_scheduler.tasks_etag)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL})
+
+    tasks, etag = await asyncio.to_thread(
+        _read_listing, task_scheduler.list_task_summaries, task_scheduler.tasks_etag, etag
+    )
+    return ORJSONResponse(tasks, headers=_list_headers(etag))
 
 
 @router.post("/tasks", response_model=TaskResponse)
 async def create_task(request: CreateTaskRequest):
     """Create a new scheduled task"""
-    try:
-        schedule_type = ScheduleType(request.schedule_type)
-    except ValueError:
+    schedule_type = _SCHEDULE_BY_VALUE.get(request.schedule_type)
+    if schedule_type is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid schedule type: {request.schedule_type}"
         )
 
-    try:
-        skill_type = SkillType(request.skill_type)
-    except ValueError:
+    skill_type = _SKILL_BY_VALUE.get(request.skill_type)
+    if skill_type is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid skill type: {request.skill_type}"
@@ -355,18 +455,18 @@ async def create_task(request: CreateTaskRequest):
 
     # Validate interval schedule
     if schedule_type == ScheduleType.INTERVAL:
-        try:
-            interval_seconds = int(request.schedule_value)
-            if interval_seconds < MIN_CRON_INTERVAL_SECONDS:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Interval too short. Minimum is {MIN_CRON_INTERVAL_SECONDS} seconds."
-                )
-        except ValueError:
+        # ASCII digits only, so int() below cannot raise
+        value = request.schedule_value
+        if not (value.isascii() and value.isdigit()):
             raise HTTPException(
                 status_code=400,
                 detail="Interval schedule_value must be a valid integer (seconds)"
             )
+        if int(value) < MIN_CRON_INTERVAL_SECONDS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Interval too short. Minimum is {MIN_CRON_INTERVAL_SECONDS} seconds."
+            )
 
     task = task_scheduler.create_task(
         task_id=request.task_id,
@@ -381,39 +481,17 @@ async def create_task(request: CreateTaskRequest):
         timezone=request.timezone,
     )
 
-    return TaskResponse(
-        task_id=task.task_id,
-        name=task.name,
-        description=task.description,
-        schedule_type=task.schedule_type.value,
-        schedule_value=task.schedule_value,
-        skill_type=task.skill_type.value,
-        status=task.status.value,
-        last_run=task.last_run,
-        next_run=task.next_run,
-        run_count=task.run_count,
-    )
+    return ORJSONResponse(_task_to_dict(task))
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(task_id: str):
     """Get a specific task"""
-    task = task_scheduler.get_task(task_id)
+    task = await asyncio.to_thread(task_scheduler.get_task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return TaskResponse(
-        task_id=task.task_id,
-        name=task.name,
-        description=task.description,
-        schedule_type=task.schedule_type.value,
-        schedule_value=task.schedule_value,
-        skill_type=task.skill_type.value,
-        status=task.status.value,
-        last_run=task.last_run,
-        next_run=task.next_run,
-        run_count=task.run_count,
-    )
+    return ORJSONResponse(_task_to_dict(task))
 
 
 @router.delete("/tasks/{task_id}")
@@ -447,35 +525,14 @@ async def run_task_now(task_id: str):
     if not result:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return TaskResultResponse(
-        task_id=result.task_id,
-        execution_id=result.execution_id,
-        started_at=result.started_at,
-        completed_at=result.completed_at,
-        success=result.success,
-        result_preview=result.result_content[:500] + "..." if len(result.result_content) > 500 else result.result_content,
-        error=result.error,
-        duration_ms=result.duration_ms,
-    )
+    return ORJSONResponse(_result_to_dict(result))
 
 
 @router.get("/tasks/{task_id}/results", response_model=list[TaskResultResponse])
 async def get_task_results(task_id: str, limit: int = Query(default=10, ge=1, le=100)):
     """Get recent execution results for a task"""
-    results = task_scheduler.get_task_results(task_id, limit)
-    return [
-        TaskResultResponse(
-            task_id=r.task_id,
-            execution_id=r.execution_id,
-            started_at=r.started_at,
-            completed_at=r.completed_at,
-            success=r.success,
-            result_preview=r.result_content[:500] + "..." if len(r.result_content) > 500 else r.result_content,
-            error=r.error,
-            duration_ms=r.duration_ms,
-        )
-        for r in results
-    ]
+    results = await asyncio.to_thread(task_scheduler.get_task_results, task_id, limit)
+    return ORJSONResponse([_result_to_dict(r) for r in results])
 
 
 # ============================================================================
@@ -506,18 +563,7 @@ async def create_daily_forecast(request: DailyForecastRequest):
         request.session_id,
         request.hour,
     )
-    return TaskResponse(
-        task_id=task.task_id,
-        name=task.name,
-        description=task.description,
-        schedule_type=task.schedule_type.value,
-        schedule_value=task.schedule_value,
-        skill_type=task.skill_type.value,
-        status=task.status.value,
-        last_run=task.last_run,
-        next_run=task.next_run,
-        run_count=task.run_count,
-    )
+    return ORJSONResponse(_task_to_dict(task))
 
 
 @router.post("/tasks/templates/weekly-report", response_model=TaskResponse)
@@ -530,33 +576,11 @@ async def create_weekly_report(request: WeeklyReportRequest):
         request.day_of_week,
         request.hour,
     )
-    return TaskResponse(
-        task_id=task.task_id,
-        name=task.name,
-        description=task.description,
-        schedule_type=task.schedule_type.value,
-        schedule_value=task.schedule_value,
-        skill_type=task.skill_type.value,
-        status=task.status.value,
-        last_run=task.last_run,
-        next_run=task.next_run,
-        run_count=task.run_count,
-    )
+    return ORJSONResponse(_task_to_dict(task))
 
 
 @router.post("/tasks/templates/solar-term-alert", response_model=TaskResponse)
 async def create_solar_term(session_id: str):
     """Create a solar term alert task from template"""
     task = create_solar_term_alert_task(task_scheduler, session_id)
-    return TaskResponse(
-        task_id=task.task_id,
-        name=task.name,
-        description=task.description,
-        schedule_type=task.schedule_type.value,
-        schedule_value=task.schedule_value,
-        skill_type=task.skill_type.value,
-        status=task.status.value,
-        last_run=task.last_run,
-        next_run=task.next_run,
-        run_count=task.run_count,
-    )
+    return ORJSONResponse(_task_to_dict(task))
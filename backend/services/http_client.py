@@ -0,0 +1,40 @@
+"""
+Shared HTTP Client
+One pooled httpx.AsyncClient for upstream API calls (NOAA, Google Maps, Anthropic)
+
+Opened during application startup and closed on shutdown, so keep-alive
+connections and TLS sessions are reused across requests instead of being
+set up per call.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing for upstream APIs
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Default timeout; individual calls may pass their own
+HTTP_TIMEOUT = httpx.Timeout(10.0)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client (created on first use)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release its pooled connections"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("HTTP client closed")
@@ -6,17 +6,41 @@ All response models include both snake_case and camelCase field aliases.
 """
 
 import os
+import re
 import math
+import time
+import unicodedata
+import asyncio
 import logging
-from typing import Optional, Literal
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, Literal, Sequence, TypeVar
 import httpx
+import orjson
 from pydantic import Field
 
-from services.redis_cache import get_cached, set_cached, CacheKeys, CacheTTL
-from utils.responses import CamelCaseModel
+from services.http_client import get_http_client
+from services.redis_cache import (
+    get_cached, set_cached, get_cached_raw, set_cached_raw, try_acquire_rate_slot,
+    CacheKeys, CacheTTL
+)
+from utils.responses import CamelCaseModel, add_camel_case_aliases
 
 logger = logging.getLogger(__name__)
 
+# Read once at import - request handlers must not touch the environment
+GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY", "")
+GOOGLE_MAPS_CONFIGURED = bool(GOOGLE_MAPS_API_KEY)
+
+# Geocoding calls per second across all instances (Google's default quota is 50)
+GEOCODE_MAX_RPS = int(os.getenv("GEOCODE_MAX_RPS", 50))
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Upstream calls currently in flight, keyed by cache key
+_inflight: dict[str, asyncio.Task] = {}
+
 
 class GeoLocation(CamelCaseModel):
     """Geocoded location data with dual-case field names"""
@@ -34,6 +58,12 @@ class GeocodeResult(CamelCaseModel):
     location: Optional[GeoLocation] = Field(default=None, description="Location data if successful")
     error: Optional[str] = Field(default=None, description="Error message if failed")
     cached: bool = Field(default=False, description="Whether result was from cache")
+    rate_limited: bool = Field(default=False, description="Whether the call was refused by the local rate limit")
+    location_json: Optional[bytes] = Field(
+        default=None,
+        exclude=True,
+        description="Dual-case location JSON, ready to splice into a response"
+    )
 
 
 class TimezoneResult(CamelCaseModel):
@@ -57,7 +87,7 @@ class StormImpact(CamelCaseModel):
 
 def is_google_maps_configured() -> bool:
     """Check if Google Maps API is configured"""
-    return bool(os.getenv("GOOGLE_MAPS_API_KEY"))
+    return GOOGLE_MAPS_CONFIGURED
 
 
 def approximate_magnetic_declination(lat: float, lng: float) -> float:
@@ -96,49 +126,139 @@ def calculate_geomagnetic_latitude(lat: float, lng: float) -> float:
     return round(geomag_lat * 180 / math.pi, 1)
 
 
+# Storm impact by minimum |geomagnetic latitude|, highest zone first
+STORM_IMPACT_ZONES: tuple[tuple[float, StormImpact], ...] = (
+    (65, StormImpact(
+        factor=1.5,
+        description="Auroral zone - Strong geomagnetic effects",
+        aurora_likelihood="very_likely"
+    )),
+    (55, StormImpact(
+        factor=1.25,
+        description="Sub-auroral zone - Enhanced effects during storms",
+        aurora_likelihood="likely"
+    )),
+    (45, StormImpact(
+        factor=1.0,
+        description="Mid-latitude - Moderate storm effects",
+        aurora_likelihood="possible"
+    )),
+    (30, StormImpact(
+        factor=0.75,
+        description="Sub-tropical - Reduced direct effects",
+        aurora_likelihood="rare"
+    )),
+    (0, StormImpact(
+        factor=0.5,
+        description="Equatorial - Minimal direct geomagnetic effects",
+        aurora_likelihood="none"
+    )),
+)
+
+
+def _storm_impact_for_geomag_lat(geomag_lat: float) -> StormImpact:
+    """Look up the storm impact zone for a geomagnetic latitude"""
+    abs_geomag_lat = abs(geomag_lat)
+    for threshold, impact in STORM_IMPACT_ZONES:
+        if abs_geomag_lat >= threshold:
+            return impact
+    return STORM_IMPACT_ZONES[-1][1]
+
+
 def get_storm_impact_factor(lat: float, lng: float) -> StormImpact:
     """
     Get storm impact factor based on location
     Higher geomagnetic latitudes experience stronger effects
     """
+    return _storm_impact_for_geomag_lat(calculate_geomagnetic_latitude(lat, lng))
+
+
+@lru_cache(maxsize=8192)
+def analyze_geomagnetics(lat: float, lng: float) -> tuple[float, float, StormImpact]:
+    """
+    Geomagnetic latitude, magnetic declination and storm impact for a location.
+
+    These are pure functions of the coordinates, so results are memoized
+    in-process; the geomagnetic latitude is computed once and shared.
+    The returned StormImpact is shared - treat it as read-only.
+    """
     geomag_lat = calculate_geomagnetic_latitude(lat, lng)
-    abs_geomag_lat = abs(geomag_lat)
+    return (
+        geomag_lat,
+        approximate_magnetic_declination(lat, lng),
+        _storm_impact_for_geomag_lat(geomag_lat),
+    )
 
-    if abs_geomag_lat >= 65:
-        return StormImpact(
-            factor=1.5,
-            description="Auroral zone - Strong geomagnetic effects",
-            aurora_likelihood="very_likely"
-        )
-    elif abs_geomag_lat >= 55:
-        return StormImpact(
-            factor=1.25,
-            description="Sub-auroral zone - Enhanced effects during storms",
-            aurora_likelihood="likely"
-        )
-    elif abs_geomag_lat >= 45:
-        return StormImpact(
-            factor=1.0,
-            description="Mid-latitude - Moderate storm effects",
-            aurora_likelihood="possible"
-        )
-    elif abs_geomag_lat >= 30:
-        return StormImpact(
-            factor=0.75,
-            description="Sub-tropical - Reduced direct effects",
-            aurora_likelihood="rare"
-        )
-    else:
-        return StormImpact(
-            factor=0.5,
-            description="Equatorial - Minimal direct geomagnetic effects",
-            aurora_likelihood="none"
+
+# Pole terms of calculate_geomagnetic_latitude, hoisted for batch evaluation
+_POLE_LAT_RAD = 80.65 * math.pi / 180
+_POLE_LNG_RAD = -72.68 * math.pi / 180
+_SIN_POLE_LAT = math.sin(_POLE_LAT_RAD)
+_COS_POLE_LAT = math.cos(_POLE_LAT_RAD)
+
+
+def analyze_geomagnetics_batch(
+    lats: Sequence[float],
+    lngs: Sequence[float]
+) -> tuple[list[float], list[float], list[StormImpact]]:
+    """
+    Column-wise analyze_geomagnetics for many coordinates.
+
+    Uses the same formulas as the scalar functions with the pole terms
+    precomputed, and returns (geomagnetic latitudes, declinations, impacts).
+    """
+    sin, cos, asin, pi = math.sin, math.cos, math.asin, math.pi
+    geomag_lats: list[float] = []
+    declinations: list[float] = []
+    impacts: list[StormImpact] = []
+
+    for lat, lng in zip(lats, lngs):
+        lat_rad = lat * pi / 180
+        lng_rad = lng * pi / 180
+        sin_lat = sin(lat_rad)
+        geomag_lat = round(asin(
+            sin_lat * _SIN_POLE_LAT +
+            cos(lat_rad) * _COS_POLE_LAT * cos(lng_rad - _POLE_LNG_RAD)
+        ) * 180 / pi, 1)
+
+        geomag_lats.append(geomag_lat)
+        declinations.append(round(-5 + (lng / 30) + sin_lat * 10, 1))
+        impacts.append(_storm_impact_for_geomag_lat(geomag_lat))
+
+    return geomag_lats, declinations, impacts
+
+
+@lru_cache(maxsize=4096)
+def normalize_address(address: str) -> str:
+    """
+    Canonical form of an address for cache keys (NFKC, lowercase, single spaces).
+
+    Memoized: clients tend to repeat a small set of addresses, and inputs are
+    capped at 500 characters by the request model, so the cache stays small.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", address)).strip().lower()
+
+
+async def _single_flight(key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run fetch() once per key at a time; concurrent callers share its result.
+
+    The call runs as its own task and is awaited through shield(), so a
+    cancelled caller doesn't cancel the lookup the others are waiting on.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(
+            lambda done: _inflight.pop(key) if _inflight.get(key) is done else None
         )
+    return await asyncio.shield(task)
 
 
 async def geocode_address(address: str) -> GeocodeResult:
     """Geocode an address to coordinates with Redis caching"""
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+    api_key = GOOGLE_MAPS_API_KEY
 
     if not api_key:
         return GeocodeResult(
@@ -146,27 +266,43 @@ async def geocode_address(address: str) -> GeocodeResult:
             error="Google Maps API key not configured"
         )
 
-    # Normalize address for cache key
-    cache_key = f"{CacheKeys.GEOCODE_PREFIX}{address.lower().strip()}"
+    # Spelling variants of the same address ("123  Main St" / "123 main st")
+    # share one cache entry
+    cache_key = f"{CacheKeys.GEOCODE_PREFIX}{normalize_address(address)}"
 
-    # Check cache first
-    cached = await get_cached(cache_key)
+    # Check cache first - the entry is already dual-case JSON, so it is passed
+    # through as bytes instead of being rebuilt into a GeoLocation
+    cached = await get_cached_raw(cache_key)
     if cached:
         return GeocodeResult(
             success=True,
-            location=GeoLocation(**cached),
+            location_json=cached.encode(),
             cached=True
         )
 
+    # Concurrent misses for the same address share one Google call
+    return await _single_flight(cache_key, lambda: _fetch_geocode(address, cache_key))
+
+
+async def _fetch_geocode(address: str, cache_key: str) -> GeocodeResult:
+    """Call the Google Geocoding API and cache a successful result"""
+    # Refuse locally rather than spend a round trip on a quota error
+    if not await try_acquire_rate_slot(CacheKeys.GMAPS_RATE_PREFIX, GEOCODE_MAX_RPS):
+        return GeocodeResult(
+            success=False,
+            rate_limited=True,
+            error="Geocoding rate limit exceeded"
+        )
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://maps.googleapis.com/maps/api/geocode/json",
-                params={"address": address, "key": api_key},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(
+            "https://maps.googleapis.com/maps/api/geocode/json",
+            params={"address": address, "key": GOOGLE_MAPS_API_KEY},
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
 
         if data.get("status") != "OK" or not data.get("results"):
             return GeocodeResult(
@@ -176,19 +312,26 @@ async def geocode_address(address: str) -> GeocodeResult:
             )
 
         result = data["results"][0]
-        location = GeoLocation(
-            lat=result["geometry"]["location"]["lat"],
-            lng=result["geometry"]["location"]["lng"],
-            formatted_address=result["formatted_address"],
-            place_id=result["place_id"]
-        )
-
-        # Cache the result
-        await set_cached(cache_key, location.model_dump(), CacheTTL.GEOCODE)
+        fields = {
+            "lat": float(result["geometry"]["location"]["lat"]),
+            "lng": float(result["geometry"]["location"]["lng"]),
+            "formatted_address": result["formatted_address"],
+            "place_id": result["place_id"],
+            "timezone": None,
+            "magnetic_declination": None
+        }
+        # The fields are already typed, so skip validation and the
+        # model_dump walk; aliases match GeoLocation.model_dump_dual()
+        location = GeoLocation.model_construct(**fields)
+
+        # Cache the serialized response fragment
+        location_json = orjson.dumps(add_camel_case_aliases(fields))
+        await set_cached_raw(cache_key, location_json, CacheTTL.GEOCODE)
 
         return GeocodeResult(
             success=True,
             location=location,
+            location_json=location_json,
             cached=False
         )
 
@@ -208,7 +351,7 @@ async def geocode_address(address: str) -> GeocodeResult:
 
 async def get_timezone(lat: float, lng: float, timestamp: Optional[int] = None) -> TimezoneResult:
     """Get timezone for coordinates"""
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+    api_key = GOOGLE_MAPS_API_KEY
 
     if not api_key:
         return TimezoneResult(
@@ -216,22 +359,33 @@ async def get_timezone(lat: float, lng: float, timestamp: Optional[int] = None)
             error="Google Maps API key not configured"
         )
 
+    ts = timestamp or int(time.time())
+
+    # Zone boundaries don't move, but DST does - bucket the key by UTC day.
+    # ~1 km rounding lets nearby lookups share an entry.
+    cache_key = f"{CacheKeys.TIMEZONE_PREFIX}{lat:.2f},{lng:.2f}:{ts // 86400}"
+    cached = await get_cached(cache_key)
+    if cached:
+        return TimezoneResult(success=True, **cached)
+
+    return await _single_flight(cache_key, lambda: _fetch_timezone(lat, lng, ts, cache_key))
+
+
+async def _fetch_timezone(lat: float, lng: float, ts: int, cache_key: str) -> TimezoneResult:
+    """Call the Google Time Zone API and cache a successful result"""
     try:
-        import time
-        ts = timestamp or int(time.time())
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://maps.googleapis.com/maps/api/timezone/json",
-                params={
-                    "location": f"{lat},{lng}",
-                    "timestamp": str(ts),
-                    "key": api_key
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(
+            "https://maps.googleapis.com/maps/api/timezone/json",
+            params={
+                "location": f"{lat},{lng}",
+                "timestamp": str(ts),
+                "key": GOOGLE_MAPS_API_KEY
+            },
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
 
         if data.get("status") != "OK":
             return TimezoneResult(
@@ -239,13 +393,15 @@ async def get_timezone(lat: float, lng: float, timestamp: Optional[int] = None)
                 error=f"Timezone lookup failed: {data.get('status')}"
             )
 
-        return TimezoneResult(
-            success=True,
-            timezone_id=data.get("timeZoneId"),
-            timezone_name=data.get("timeZoneName"),
-            raw_offset=data.get("rawOffset"),
-            dst_offset=data.get("dstOffset")
-        )
+        timezone = {
+            "timezone_id": data.get("timeZoneId"),
+            "timezone_name": data.get("timeZoneName"),
+            "raw_offset": data.get("rawOffset"),
+            "dst_offset": data.get("dstOffset")
+        }
+        await set_cached(cache_key, timezone, CacheTTL.TIMEZONE)
+
+        return TimezoneResult(success=True, **timezone)
 
     except httpx.HTTPStatusError as e:
         logger.warning(f"Timezone HTTP error: {e.response.status_code}")
@@ -18,11 +18,15 @@ import math
 import logging
 from datetime import datetime, timezone
 from typing import List, Literal, Optional
-import httpx
+
+import orjson
 from pydantic import Field
 
-from services.redis_cache import get_or_compute, CacheKeys, CacheTTL
-from utils.responses import CamelCaseModel
+from services.http_client import get_http_client
+from services.redis_cache import (
+    get_or_compute, get_cached_raw, set_cached_raw, CacheKeys, CacheTTL
+)
+from utils.responses import CamelCaseModel, add_camel_case_aliases
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +57,8 @@ def get_storm_status(kp: float) -> Literal["quiet", "unsettled", "storm"]:
     return "quiet"
 
 
-def get_kindex_description(kp: float) -> str:
-    """Get human-readable K-Index description"""
+def _compute_kindex_description(kp: float) -> str:
+    """Human-readable K-Index description (source of _DESCRIPTION_LUT)"""
     if kp >= 9:
         return "Extreme Geomagnetic Storm (G5)"
     if kp >= 8:
@@ -70,8 +74,8 @@ def get_kindex_description(kp: float) -> str:
     return "Quiet Conditions"
 
 
-def get_kindex_color(kp: float) -> str:
-    """Get color code for K-Index visualization"""
+def _compute_kindex_color(kp: float) -> str:
+    """K-Index visualization color (source of _COLOR_LUT)"""
     if kp >= 8:
         return "#dc2626"  # red-600
     if kp >= 7:
@@ -85,6 +89,29 @@ def get_kindex_color(kp: float) -> str:
     return "#10b981"  # emerald-500
 
 
+# Every description/color threshold is a whole Kp value, so one entry per
+# Kp unit (0-9) reproduces the branch chains exactly
+_DESCRIPTION_LUT = tuple(_compute_kindex_description(kp) for kp in range(10))
+_COLOR_LUT = tuple(_compute_kindex_color(kp) for kp in range(10))
+
+
+def _kp_bucket(kp: float) -> int:
+    """Lookup table index for a K-Index value (clamped to 0-9; NaN -> 0)"""
+    if kp >= 9:
+        return 9
+    return int(kp) if kp > 0 else 0
+
+
+def get_kindex_description(kp: float) -> str:
+    """Get human-readable K-Index description"""
+    return _DESCRIPTION_LUT[_kp_bucket(kp)]
+
+
+def get_kindex_color(kp: float) -> str:
+    """Get color code for K-Index visualization"""
+    return _COLOR_LUT[_kp_bucket(kp)]
+
+
 def get_mock_kindex_data() -> dict:
     """Generate mock data for development and error fallback"""
     now = datetime.now(timezone.utc)
@@ -121,14 +148,14 @@ def get_mock_kindex_data() -> dict:
 async def fetch_kindex_from_api() -> dict:
     """Direct API fetch from NOAA"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://services.swpc.noaa.gov/products/noaa-planetary-k-index.json",
-                headers={"Accept": "application/json"},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(
+            "https://services.swpc.noaa.gov/products/noaa-planetary-k-index.json",
+            headers={"Accept": "application/json"},
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
 
         if not isinstance(data, list):
             raise ValueError("Invalid response format from NOAA API")
@@ -182,3 +209,36 @@ async def fetch_kindex() -> dict:
         fetch_kindex_from_api,
         CacheTTL.NOAA_DATA
     )
+
+
+async def fetch_kindex_json() -> tuple[Optional[bytes], bool]:
+    """
+    Fetch the /api/noaa payload as dual-case JSON bytes.
+
+    The latest reading's description and color are pure functions of kp, so
+    they are baked in before serializing and the result is cached in Redis;
+    a cache hit is served without decoding or re-encoding anything.
+    Simulated fallback data is never cached in this form.
+
+    Returns:
+        (payload, is_simulated) - payload is None if no data is available
+    """
+    cached = await get_cached_raw(CacheKeys.NOAA_KINDEX_JSON)
+    if cached:
+        return cached.encode(), False
+
+    data = await fetch_kindex()
+    if not data:
+        return None, False
+
+    if "latest" in data:
+        kp = data["latest"]["kp_index"]
+        data["description"] = get_kindex_description(kp)
+        data["color"] = get_kindex_color(kp)
+
+    payload = orjson.dumps(add_camel_case_aliases(data))
+    is_simulated = data.get("is_simulated", False)
+    if not is_simulated:
+        await set_cached_raw(CacheKeys.NOAA_KINDEX_JSON, payload, CacheTTL.NOAA_RESPONSE)
+
+    return payload, is_simulated
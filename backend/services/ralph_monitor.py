@@ -20,11 +20,12 @@ Environment Variables:
 
 import os
 import sys
+import asyncio
 import json
 import hmac
 import hashlib
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Coroutine
 from datetime import datetime, timezone
 
 try:
@@ -74,12 +75,25 @@ def get_uptime_seconds() -> int:
 # Signature Utilities
 # ============================================================================
 
+# Keyed HMAC state built once; each signature starts from a copy of it
+_HMAC_TEMPLATE = hmac.new(SECRET.encode(), digestmod=hashlib.sha256) if SECRET else None
+
+# Length of a hex-encoded SHA-256 digest
+_SIGNATURE_HEX_LENGTH = 64
+
+
+def _hex_digest(payload: bytes) -> str:
+    """HMAC-SHA256 hex digest of payload using the shared secret."""
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(payload)
+    return mac.hexdigest()
+
+
 def _sign_payload(payload: bytes) -> str:
     """Generate HMAC-SHA256 signature for payload."""
     if not SECRET:
         return ""
-    digest = hmac.new(SECRET.encode(), payload, hashlib.sha256).hexdigest()
-    return f"sha256={digest}"
+    return f"sha256={_hex_digest(payload)}"
 
 
 def verify_signature(body: bytes, signature: str) -> bool:
@@ -100,12 +114,15 @@ def verify_signature(body: bytes, signature: str) -> bool:
         logger.warning("No signature provided in request")
         return False
 
-    expected = _sign_payload(body)
-
     # Handle both with and without "sha256=" prefix
     if signature.startswith("sha256="):
-        return hmac.compare_digest(expected, signature)
-    return hmac.compare_digest(expected[7:], signature)
+        signature = signature[7:]
+
+    # Reject malformed signatures before hashing a (possibly large) body
+    if len(signature) != _SIGNATURE_HEX_LENGTH:
+        return False
+
+    return hmac.compare_digest(_hex_digest(body), signature)
 
 
 # ============================================================================
@@ -355,6 +372,52 @@ async def info_async(title: str, message: str = "", **metadata) -> dict:
     return await send_event_async("info", title, message, "info", metadata)
 
 
+# ============================================================================
+# Background Reporting
+# ============================================================================
+
+# Cap on reports in flight to Ralph at once
+MAX_CONCURRENT_REPORTS = 16
+# How long a report may wait for a free slot before it is dropped
+REPORT_SLOT_TIMEOUT = 0.1
+
+_report_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
+# Strong references to in-flight report tasks (the event loop only keeps weak ones)
+_pending_reports: set[asyncio.Task] = set()
+dropped_reports = 0
+
+
+async def _send_report(coro: Coroutine) -> None:
+    """Await a report once a slot is free; drop it if Ralph is backed up."""
+    global dropped_reports
+    try:
+        await asyncio.wait_for(_report_semaphore.acquire(), REPORT_SLOT_TIMEOUT)
+    except asyncio.TimeoutError:
+        coro.close()
+        dropped_reports += 1
+        logger.debug(f"Dropped Ralph report ({dropped_reports} dropped so far)")
+        return
+    try:
+        await coro
+    except Exception as e:
+        logger.warning(f"Failed to send report to Ralph: {e}")
+    finally:
+        _report_semaphore.release()
+
+
+def report_in_background(coro: Coroutine) -> None:
+    """
+    Send a report to Ralph without blocking the caller.
+
+    Shared by the error middleware and the 500 handler so an error storm is
+    bounded by one limit: at most MAX_CONCURRENT_REPORTS are in flight, and
+    reports that can't get a slot within REPORT_SLOT_TIMEOUT are dropped.
+    """
+    task = asyncio.create_task(_send_report(coro))
+    _pending_reports.add(task)
+    task.add_done_callback(_pending_reports.discard)
+
+
 def startup(version: str = APP_VERSION) -> dict:
     """
     Send startup event to Ralph.
@@ -8,6 +8,7 @@ import json
 import logging
 import threading
 import asyncio
+import time
 from typing import TypeVar, Optional, Callable, Any
 
 logger = logging.getLogger(__name__)
@@ -81,16 +82,21 @@ class CacheKeys:
     """Cache keys used throughout the application"""
     NOAA_KINDEX = "noaa:kindex:latest"
     NOAA_KINDEX_HISTORY = "noaa:kindex:history"
-    GEOCODE_PREFIX = "geocode:"
+    NOAA_KINDEX_JSON = "noaa:kindex:latest:json"
+    GEOCODE_PREFIX = "geocode:v2:"
+    TIMEZONE_PREFIX = "timezone:"
     SOLAR_TERMS = "astronomy:solar_terms:"
     ZODIAC_CALC = "zodiac:calc:"
     LOCK_PREFIX = "lock:"
+    GMAPS_RATE_PREFIX = "ratelimit:gmaps:"
 
 
 class CacheTTL:
     """Cache TTLs in seconds"""
     NOAA_DATA = 300          # 5 minutes
+    NOAA_RESPONSE = 60       # 1 minute (serialized /api/noaa payload)
     GEOCODE = 86400 * 30     # 30 days
+    TIMEZONE = 86400 * 2     # 2 days (keys are bucketed per UTC day)
     SOLAR_TERMS = 86400      # 1 day
     ZODIAC = 86400 * 365     # 1 year
     LOCK = 30                # Lock timeout
@@ -127,6 +133,65 @@ async def set_cached(key: str, value: Any, ttl_seconds: int) -> bool:
         return False
 
 
+async def get_cached_raw(key: str) -> Optional[str]:
+    """Get a cached JSON string without decoding it (runs in thread pool)"""
+    client = get_redis_client()
+    if not client:
+        return None
+
+    try:
+        return await asyncio.to_thread(client.get, key)
+    except Exception as e:
+        logger.warning(f"Redis GET error for key {key}: {e}")
+        return None
+
+
+async def set_cached_raw(key: str, value: bytes, ttl_seconds: int) -> bool:
+    """Set an already-serialized JSON value with TTL (runs in thread pool)"""
+    client = get_redis_client()
+    if not client:
+        return False
+
+    try:
+        await asyncio.to_thread(client.setex, key, ttl_seconds, value)
+        return True
+    except Exception as e:
+        logger.warning(f"Redis SET error for key {key}: {e}")
+        return False
+
+
+def _incr_window(client, key: str, ttl: int) -> int:
+    """INCR a counter and set its expiry in one round trip."""
+    pipe = client.pipeline()
+    pipe.incr(key)
+    pipe.expire(key, ttl)
+    return pipe.execute()[0]
+
+
+async def try_acquire_rate_slot(prefix: str, limit: int) -> bool:
+    """
+    Shared per-second rate limit across all app instances.
+
+    Counts calls in a Redis key named after the current second, so the
+    window rolls over without a separate reset. Fails open when Redis is
+    unavailable - the limit protects a supplier quota, not this service.
+
+    Returns:
+        True if the call may proceed, False if this second's budget is spent
+    """
+    client = get_redis_client()
+    if not client:
+        return True
+
+    key = f"{prefix}{int(time.time())}"
+    try:
+        count = await asyncio.to_thread(_incr_window, client, key, 2)
+        return count <= limit
+    except Exception as e:
+        logger.warning(f"Redis rate limit error for key {key}: {e}")
+        return True
+
+
 async def _acquire_lock(client, lock_key: str, ttl: int = CacheTTL.LOCK) -> bool:
     """Acquire a distributed lock using SETNX."""
     try:
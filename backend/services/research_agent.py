@@ -18,7 +18,8 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Optional
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-import httpx
+
+from services.http_client import get_http_client
 
 # ============================================================================
 # Configuration
@@ -48,6 +49,10 @@ class SkillType(str, Enum):
     DISCUSS = "discuss"  # Free-form discussion
 
 
+# Enum member -> string value, a plain dict load instead of the .value descriptor
+SKILL_TYPE_VALUES: dict[SkillType, str] = {s: s.value for s in SkillType}
+
+
 @dataclass
 class ResearchMessage:
     """A single message in a research conversation"""
@@ -286,6 +291,26 @@ Each sign has primary and secondary color associations.
 # Memory Management (Nanoclaw Pattern)
 # ============================================================================
 
+def directory_etag(directory: str, prefix: str, suffix: str = ".json") -> str:
+    """
+    Fingerprint of the matching files in a directory, for HTTP ETags.
+
+    Built from each file's name, size and mtime (no file contents are read),
+    so it changes whenever a file is written, added or removed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with os.scandir(directory) as entries:
+        stats = sorted(
+            (entry.name, st.st_mtime_ns, st.st_size)
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+            for st in (entry.stat(),)
+        )
+    for name, mtime_ns, size in stats:
+        digest.update(f"{name}:{mtime_ns}:{size};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
 class MemoryManager:
     """Manages research session persistence using the nanoclaw CLAUDE.md pattern"""
 
@@ -357,6 +382,10 @@ class MemoryManager:
             session = self.create_session(session_id, initial_context)
         return session
 
+    def sessions_etag(self) -> str:
+        """ETag for the current set of stored sessions"""
+        return directory_etag(self.memory_dir, "session_")
+
     def list_sessions(self) -> list[dict]:
         """List all sessions with metadata"""
         sessions = []
@@ -411,29 +440,30 @@ class ResearchAgent:
         if not self.api_key:
             return "[Error: ANTHROPIC_API_KEY not configured]"
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": DEFAULT_MODEL,
-                    "max_tokens": max_tokens,
-                    "system": system,
-                    "messages": messages,
-                },
-            )
+        client = get_http_client()
+        response = await client.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": DEFAULT_MODEL,
+                "max_tokens": max_tokens,
+                "system": system,
+                "messages": messages,
+            },
+            timeout=60.0,
+        )
 
-            if response.status_code != 200:
-                return f"[Error: API call failed with status {response.status_code}]"
+        if response.status_code != 200:
+            return f"[Error: API call failed with status {response.status_code}]"
 
-            data = response.json()
-            if "content" in data and len(data["content"]) > 0:
-                return data["content"][0].get("text", "[No response content]")
-            return "[No response content]"
+        data = response.json()
+        if "content" in data and len(data["content"]) > 0:
+            return data["content"][0].get("text", "[No response content]")
+        return "[No response content]"
 
     def _build_context_prompt(self, context: dict) -> str:
         """Build a context summary for the prompt"""
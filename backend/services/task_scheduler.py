@@ -18,6 +18,9 @@ import asyncio
 import json
 import os
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Optional
 from dataclasses import dataclass, field, asdict
@@ -32,7 +35,7 @@ try:
 except ImportError:
     HAS_CRONITER = False
 
-from .research_agent import research_agent, SkillType
+from .research_agent import research_agent, SkillType, SKILL_TYPE_VALUES, directory_etag
 
 
 # ============================================================================
@@ -42,6 +45,9 @@ from .research_agent import research_agent, SkillType
 TASKS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "scheduled_tasks")
 TASK_RESULTS_DIR = os.path.join(TASKS_DIR, "results")
 POLL_INTERVAL_SECONDS = 60  # Check for due tasks every minute
+TASK_CACHE_TTL_SECONDS = 5.0  # How long a loaded task is served from memory
+TASK_CACHE_MAX_ENTRIES = 256
+CRON_CACHE_MAX_ENTRIES = 256  # Parsed cron expressions kept for reuse
 
 
 # ============================================================================
@@ -64,6 +70,16 @@ class TaskStatus(str, Enum):
     DISABLED = "disabled"
 
 
+# Enum member -> string value, a plain dict load instead of the .value descriptor
+SCHEDULE_TYPE_VALUES: dict[ScheduleType, str] = {s: s.value for s in ScheduleType}
+TASK_STATUS_VALUES: dict[TaskStatus, str] = {s: s.value for s in TaskStatus}
+
+# Valid string values for the stored enum fields, checked when listing from disk
+_SCHEDULE_TYPE_STRINGS = frozenset(SCHEDULE_TYPE_VALUES.values())
+_SKILL_TYPE_STRINGS = frozenset(SKILL_TYPE_VALUES.values())
+_TASK_STATUS_STRINGS = frozenset(TASK_STATUS_VALUES.values())
+
+
 @dataclass
 class ScheduledTask:
     """A scheduled research task"""
@@ -98,9 +114,9 @@ class ScheduledTask:
     def to_dict(self) -> dict:
         return {
             **asdict(self),
-            "schedule_type": self.schedule_type.value,
-            "skill_type": self.skill_type.value,
-            "status": self.status.value,
+            "schedule_type": SCHEDULE_TYPE_VALUES[self.schedule_type],
+            "skill_type": SKILL_TYPE_VALUES[self.skill_type],
+            "status": TASK_STATUS_VALUES[self.status],
         }
 
     @classmethod
@@ -151,6 +167,18 @@ class TaskStorage:
         self.results_dir = results_dir
         os.makedirs(tasks_dir, exist_ok=True)
         os.makedirs(results_dir, exist_ok=True)
+        # task_id -> (loaded_at, stored JSON text); LRU order, refreshed by every
+        # save. Text rather than tasks, so each caller decodes its own
+        # ScheduledTask and in-place changes never leak before they are saved.
+        self._task_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_task(self, task_id: str, text: str) -> None:
+        with self._cache_lock:
+            self._task_cache[task_id] = (time.monotonic(), text)
+            self._task_cache.move_to_end(task_id)
+            if len(self._task_cache) > TASK_CACHE_MAX_ENTRIES:
+                self._task_cache.popitem(last=False)
 
     def _get_task_path(self, task_id: str) -> str:
         safe_id = hashlib.sha256(task_id.encode()).hexdigest()[:16]
@@ -164,23 +192,39 @@ class TaskStorage:
         """Save a task to disk"""
         task.updated_at = datetime.now(timezone.utc).isoformat()
         path = self._get_task_path(task.task_id)
+        text = json.dumps(task.to_dict(), indent=2)
         with open(path, "w") as f:
-            json.dump(task.to_dict(), f, indent=2)
+            f.write(text)
+        self._cache_task(task.task_id, text)
 
     def load_task(self, task_id: str) -> Optional[ScheduledTask]:
-        """Load a task from disk"""
-        path = self._get_task_path(task_id)
-        if not os.path.exists(path):
-            return None
-        try:
+        """Load a task, served from a short-lived cache when recently read or saved"""
+        with self._cache_lock:
+            entry = self._task_cache.get(task_id)
+            if entry is not None and time.monotonic() - entry[0] < TASK_CACHE_TTL_SECONDS:
+                self._task_cache.move_to_end(task_id)
+                text = entry[1]
+            else:
+                text = None
+
+        if text is None:
+            # Misses are not cached, so a task written out-of-band shows up at once
+            path = self._get_task_path(task_id)
+            if not os.path.exists(path):
+                return None
             with open(path, "r") as f:
-                data = json.load(f)
-                return ScheduledTask.from_dict(data)
+                text = f.read()
+            self._cache_task(task_id, text)
+
+        try:
+            return ScheduledTask.from_dict(json.loads(text))
         except (json.JSONDecodeError, KeyError):
             return None
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
+        with self._cache_lock:
+            self._task_cache.pop(task_id, None)
         path = self._get_task_path(task_id)
         if os.path.exists(path):
             os.remove(path)
@@ -201,6 +245,49 @@ class TaskStorage:
                     continue
         return tasks
 
+    def tasks_etag(self) -> str:
+        """ETag for the current set of stored tasks"""
+        return directory_etag(self.tasks_dir, "task_")
+
+    def list_task_summaries(self) -> list[dict]:
+        """
+        List the API summary fields of all tasks in one pass over storage.
+
+        Reads the stored JSON directly, where enum fields are already their
+        string values, instead of rebuilding each ScheduledTask. Records
+        whose enum fields don't hold a known value are skipped, like
+        records with missing fields.
+        """
+        summaries = []
+        for filename in os.listdir(self.tasks_dir):
+            if filename.startswith("task_") and filename.endswith(".json"):
+                path = os.path.join(self.tasks_dir, filename)
+                try:
+                    with open(path, "r") as f:
+                        data = json.load(f)
+                    status = data.get("status", "pending")
+                    if (
+                        data["schedule_type"] not in _SCHEDULE_TYPE_STRINGS
+                        or data["skill_type"] not in _SKILL_TYPE_STRINGS
+                        or status not in _TASK_STATUS_STRINGS
+                    ):
+                        continue
+                    summaries.append({
+                        "task_id": data["task_id"],
+                        "name": data["name"],
+                        "description": data["description"],
+                        "schedule_type": data["schedule_type"],
+                        "schedule_value": data["schedule_value"],
+                        "skill_type": data["skill_type"],
+                        "status": status,
+                        "last_run": data.get("last_run"),
+                        "next_run": data.get("next_run"),
+                        "run_count": data.get("run_count", 0),
+                    })
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+        return summaries
+
     def save_result(self, result: TaskResult) -> None:
         """Save a task execution result"""
         path = self._get_result_path(result.task_id, result.execution_id)
@@ -232,6 +319,33 @@ class TaskStorage:
 # Schedule Calculator
 # ============================================================================
 
+# Parsed croniter per expression; rewound with set_current() on each use
+_cron_cache: dict[str, "croniter"] = {}
+_cron_lock = threading.Lock()
+
+
+def next_cron_runs(cron_expr: str, start: datetime, count: int = 1) -> list[datetime]:
+    """
+    Next `count` run times of a cron expression after `start`.
+
+    The expression is parsed once and cached, so tasks sharing a schedule
+    (and repeated ticks of the same task) skip re-tokenizing it.
+
+    Raises:
+        CroniterError (a ValueError) if the expression is invalid
+    """
+    with _cron_lock:
+        cron = _cron_cache.get(cron_expr)
+        if cron is None:
+            cron = croniter(cron_expr, start)
+            if len(_cron_cache) >= CRON_CACHE_MAX_ENTRIES:
+                _cron_cache.clear()
+            _cron_cache[cron_expr] = cron
+        else:
+            cron.set_current(start, force=True)
+        return [cron.get_next(datetime) for _ in range(count)]
+
+
 class ScheduleCalculator:
     """Calculates next run times for tasks"""
 
@@ -247,8 +361,7 @@ class ScheduleCalculator:
                 return next_run.replace(hour=9, minute=0, second=0, microsecond=0)
 
             try:
-                cron = croniter(task.schedule_value, now)
-                return cron.get_next(datetime)
+                return next_cron_runs(task.schedule_value, now)[0]
             except (ValueError, KeyError):
                 return None
 
@@ -436,6 +549,14 @@ class TaskScheduler:
         """List all tasks"""
         return self.storage.list_tasks()
 
+    def list_task_summaries(self) -> list[dict]:
+        """List all tasks as API summary dicts"""
+        return self.storage.list_task_summaries()
+
+    def tasks_etag(self) -> str:
+        """ETag for the current set of tasks"""
+        return self.storage.tasks_etag()
+
     def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
         return self.storage.delete_task(task_id)
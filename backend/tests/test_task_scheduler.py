@@ -0,0 +1,77 @@
+"""
+Tests for TaskStorage listing from stored JSON.
+
+Run from the backend directory:
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from services.research_agent import SkillType
+from services.task_scheduler import ScheduledTask, ScheduleType, TaskStorage
+
+
+class ListTaskSummariesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.storage = TaskStorage(
+            tasks_dir=os.path.join(self._tmp.name, "tasks"),
+            results_dir=os.path.join(self._tmp.name, "results"),
+        )
+
+    def _save(self, task_id: str) -> str:
+        self.storage.save_task(ScheduledTask(
+            task_id=task_id,
+            name="Daily forecast",
+            description="Forecast for today",
+            schedule_type=ScheduleType.INTERVAL,
+            schedule_value="3600",
+            skill_type=SkillType.FORECAST_PERIOD,
+        ))
+        return self.storage._get_task_path(task_id)
+
+    def _rewrite(self, path: str, **fields) -> None:
+        with open(path) as f:
+            data = json.load(f)
+        data.update(fields)
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    def test_lists_valid_task(self):
+        self._save("good")
+        summaries = self.storage.list_task_summaries()
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]["task_id"], "good")
+        self.assertEqual(summaries[0]["schedule_type"], "interval")
+        self.assertEqual(summaries[0]["skill_type"], "forecast_period")
+        self.assertEqual(summaries[0]["status"], "pending")
+
+    def test_skips_bad_enum_values(self):
+        self._save("good")
+        self._rewrite(self._save("bad_schedule"), schedule_type="fortnightly")
+        self._rewrite(self._save("bad_skill"), skill_type="divination")
+        self._rewrite(self._save("bad_status"), status="exploded")
+        self._rewrite(self._save("unhashable_status"), status=["active"])
+
+        summaries = self.storage.list_task_summaries()
+        self.assertEqual([s["task_id"] for s in summaries], ["good"])
+
+    def test_skips_missing_fields(self):
+        self._save("good")
+        path = self._save("no_skill")
+        with open(path) as f:
+            data = json.load(f)
+        del data["skill_type"]
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        summaries = self.storage.list_task_summaries()
+        self.assertEqual([s["task_id"] for s in summaries], ["good"])
+
+
+if __name__ == "__main__":
+    unittest.main()
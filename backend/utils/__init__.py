@@ -9,8 +9,12 @@ from .responses import (
     create_error_response,
     success_response,
     error_response,
+    response_meta,
+    add_camel_case_aliases,
     CamelCaseModel,
     to_camel_case,
+    ORJSONResponse,
+    ErrorTemplate,
 )
 
 __all__ = [
@@ -20,6 +24,10 @@ __all__ = [
     "create_error_response",
     "success_response",
     "error_response",
+    "response_meta",
+    "add_camel_case_aliases",
     "CamelCaseModel",
     "to_camel_case",
+    "ORJSONResponse",
+    "ErrorTemplate",
 ]
@@ -6,19 +6,38 @@ This ensures API compatibility with different client conventions.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 from datetime import datetime, timezone
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
+from starlette.responses import JSONResponse, Response
 
 
 T = TypeVar('T')
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Used as the application's default response class; orjson is several
+    times faster than the stdlib encoder for our response payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=1024)
 def to_camel_case(snake_str: str) -> str:
     """
     Convert snake_case to camelCase
 
+    Memoized: response keys come from a small fixed set of field names, so
+    after warm-up every conversion is a single cache lookup.
+
     Examples:
         >>> to_camel_case('hello_world')
         'helloWorld'
@@ -67,12 +86,10 @@ class CamelCaseModel(BaseModel):
         Dump model with both snake_case and camelCase fields.
         Returns a dictionary containing both naming conventions for each field.
         """
-        # Get the snake_case version (by_alias=False)
+        # Get the snake_case version (by_alias=False); camelCase keys are
+        # derived from the field names below rather than from a second dump
         snake_dict = self.model_dump(by_alias=False, **kwargs)
 
-        # Get the camelCase version (by_alias=True)
-        camel_dict = self.model_dump(by_alias=True, **kwargs)
-
         # Merge both - snake_case fields with camelCase aliases added
         result = {}
         for key, value in snake_dict.items():
@@ -238,6 +255,29 @@ def create_error_response(
     return response.model_dump_response()
 
 
+def response_meta(cached: bool = False, source: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the dual-case meta block for a successful response.
+
+    Useful with payloads that were passed through add_camel_case_aliases
+    ahead of time, e.g. static documentation built once at import.
+
+    Args:
+        cached: Whether data was served from cache
+        source: Data source identifier
+
+    Returns:
+        Meta dictionary with snake_case and camelCase keys
+    """
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+        "cached": cached,
+    }
+    if source:
+        meta["source"] = source
+    return add_camel_case_aliases(meta)
+
+
 def success_response(
     data: Any,
     cached: bool = False,
@@ -254,12 +294,7 @@ def success_response(
     Returns:
         Standardized response dictionary
     """
-    meta = {
-        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
-        "cached": cached,
-    }
-    if source:
-        meta["source"] = source
+    meta = response_meta(cached=cached, source=source)
 
     # Process the data
     if isinstance(data, BaseModel):
@@ -279,7 +314,7 @@ def success_response(
     return {
         "success": True,
         "data": processed_data,
-        "meta": add_camel_case_aliases(meta)
+        "meta": meta
     }
 
 
@@ -335,3 +370,48 @@ class ErrorCodes:
     BAD_REQUEST = "BAD_REQUEST"
     EXTERNAL_API_ERROR = "EXTERNAL_API_ERROR"
     CACHE_ERROR = "CACHE_ERROR"
+
+
+class ErrorTemplate:
+    """
+    Pre-serialized error response for a fixed code/field.
+
+    The envelope is encoded once; each response only splices in the current
+    timestamp (and the message, when one is given per response), so error
+    paths skip building and encoding the error_response() dict.
+
+    Usage:
+        INTERNAL_ERROR = ErrorTemplate(ErrorCodes.INTERNAL_ERROR, "Request failed", 500)
+        NOT_FOUND = ErrorTemplate(ErrorCodes.NOT_FOUND, "Resource not found", 404)
+
+        return INTERNAL_ERROR.response()
+        return NOT_FOUND.response(f"Endpoint not found: {path}")
+    """
+    __slots__ = ("status_code", "_message", "_head", "_mid", "_tail")
+
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        status_code: int = 400,
+        field: Optional[str] = None
+    ):
+        self.status_code = status_code
+        self._message = orjson.dumps(message)
+        body = error_response(code, "__MESSAGE__", status_code=status_code, field=field)
+        body["meta"]["timestamp"] = "__TIMESTAMP__"
+        self._head, rest = orjson.dumps(body).split(b'"__MESSAGE__"')
+        self._mid, self._tail = rest.split(b'"__TIMESTAMP__"')
+
+    def response(self, message: Optional[str] = None) -> Response:
+        """Build the error response with a fresh timestamp, optionally overriding the message"""
+        timestamp = orjson.dumps(datetime.now(timezone.utc).isoformat() + "Z")
+        return Response(
+            b"".join((
+                self._head,
+                self._message if message is None else orjson.dumps(message),
+                self._mid, timestamp, self._tail,
+            )),
+            status_code=self.status_code,
+            media_type="application/json"
+        )